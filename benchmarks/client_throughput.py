@@ -0,0 +1,97 @@
+"""
+Crash2Client throughput against the in-process FakeBizHawk connector.
+
+Run from an Archipelago checkout with the world installed as worlds/crash2:
+    PYTHONPATH=. python <path>/benchmarks/client_throughput.py --ticks 5000
+"""
+import argparse
+import asyncio
+import time
+from typing import List
+
+
+def percentile(samples: List[float], p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+
+def build_script(fake, ticks: int, stage_ticks: int) -> None:
+    """Plays every stage in turn: enter it, collect its locations and floor boss, return to the warp room."""
+    from worlds.crash2.Crash2Addresses import LEVEL, LOCATIONS
+    from worlds.crash2.LevelStates import LEVEL_CHECKS
+
+    locations = {location["Id"]: location for location in LOCATIONS}
+    fake.set_level(LEVEL.WarpRoom)
+    tick = 1
+    for level, ap_codes in LEVEL_CHECKS.items():
+        if tick + stage_ticks >= ticks:
+            break
+        fake.at(tick, lambda f, level=level: f.set_level(level))
+        for ap_code in ap_codes:
+            fake.at(tick + stage_ticks // 2,
+                    lambda f, loc=locations[ap_code]: f.set_flag(loc["Address"], loc["AddressBit"]))
+        fake.at(tick + stage_ticks, lambda f: f.set_level(LEVEL.WarpRoom))
+        tick += stage_ticks * 2
+
+
+async def run(ticks: int, stage_ticks: int, items_every: int, record: str) -> None:
+    from NetUtils import NetworkItem
+    from worlds._bizhawk.context import BizHawkClientContext
+    from worlds.crash2.Client import start_ram_trace
+    from worlds.crash2.ClientShim import Crash2Client
+    from worlds.crash2.test.fake_bizhawk import FakeBizHawk, setup_offline_slot
+    from worlds.crash2.Items import item_table
+
+    fake = FakeBizHawk()
+    build_script(fake, ticks, stage_ticks)
+    ctx = BizHawkClientContext(None, None)
+    await fake.connect(ctx.bizhawk_ctx)
+    client = Crash2Client()
+
+    start = time.perf_counter()
+    if not await client.validate_rom(ctx):
+        raise RuntimeError("validate_rom rejected the fake connector")
+    validate_ms = (time.perf_counter() - start) * 1000
+
+    setup_offline_slot(ctx)
+    if record:
+        start_ram_trace(ctx, record)
+
+    power_stone = item_table["Power Stone"].ap_code
+    durations: List[float] = []
+    fake.request_counts.clear()
+    fake.messages = 0
+    bench_start = time.perf_counter()
+    for tick in range(ticks):
+        fake.advance()
+        if items_every and tick % items_every == 0:
+            ctx.items_received.append(NetworkItem(power_stone, 0, 1, 0))
+        t0 = time.perf_counter()
+        await client.game_watcher(ctx)
+        durations.append((time.perf_counter() - t0) * 1000)
+    elapsed = time.perf_counter() - bench_start
+    if record:
+        start_ram_trace(ctx, "")
+
+    await fake.stop()
+    print(f"validate_rom:    {validate_ms:.3f} ms")
+    print(f"ticks:           {ticks} in {elapsed:.3f} s ({ticks / elapsed:.1f} ticks/s)")
+    print(f"tick latency:    p50 {percentile(durations, 50):.3f} ms, p95 {percentile(durations, 95):.3f} ms, "
+          f"p99 {percentile(durations, 99):.3f} ms, max {max(durations):.3f} ms")
+    print(f"messages:        {fake.messages} ({fake.messages / ticks:.2f}/tick)")
+    print(f"requests:        {dict(fake.request_counts)}")
+    print(f"locations sent:  {len(ctx.sent_checks)} / {len(ctx.server_locations)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ticks", type=int, default=5000)
+    parser.add_argument("--stage-ticks", type=int, default=40, help="ticks spent in each stage")
+    parser.add_argument("--items-every", type=int, default=100, help="receive a Power Stone every N ticks, 0 to disable")
+    parser.add_argument("--record", default="", help="also record a RAM trace of the run to this file")
+    args = parser.parse_args()
+    asyncio.run(run(args.ticks, args.stage_ticks, args.items_every, args.record))
+
+
+if __name__ == "__main__":
+    main()
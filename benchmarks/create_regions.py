@@ -0,0 +1,72 @@
+"""
+Region creation cost as the number of Crash 2 slots in a multiworld grows.
+
+"indexed" is Regions.create_regions, which takes each region's locations from Index.location_index.
+"scan" rebuilds the same regions by scanning the whole location_table per region, as create_region used to.
+The per-slot time should stay flat for both, with "indexed" doing a fraction of the work.
+
+Run from an Archipelago checkout with the world installed as worlds/crash2:
+    PYTHONPATH=. python <path>/benchmarks/create_regions.py --slots 1 8 32 128
+"""
+import argparse
+import time
+from typing import Callable
+
+
+def build_multiworld(slots: int):
+    from BaseClasses import MultiWorld
+    from worlds.crash2 import Crash2World
+
+    multiworld = MultiWorld(slots)
+    multiworld.set_seed(0)
+    for player in range(1, slots + 1):
+        multiworld.game[player] = Crash2World.game
+        multiworld.player_name[player] = f"Player{player}"
+        multiworld.worlds[player] = Crash2World(multiworld, player)
+    return multiworld
+
+
+def scan_create_regions(world) -> None:
+    from BaseClasses import Region
+    from worlds.crash2.Locations import location_table
+    from worlds.crash2.Regions import Crash2Location
+
+    names = ["Menu", "1F", "2F", "3F", "4F", "5F", "6F", "Stage26", "Stage27"]
+    for name in names:
+        reg = Region(name, world.player, world.multiworld)
+        for key, data in location_table.items():
+            if data.region == name:
+                reg.locations.append(Crash2Location(world.player, key, data.ap_code, reg))
+        world.multiworld.regions.append(reg)
+
+
+def time_creation(slots: int, create: Callable, repeat: int) -> float:
+    """Best total seconds to create every slot's regions."""
+    best = float("inf")
+    for _ in range(repeat):
+        multiworld = build_multiworld(slots)
+        start = time.perf_counter()
+        for world in multiworld.worlds.values():
+            create(world)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    from worlds.crash2.Regions import create_regions
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--slots", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'slots':>6} {'indexed ms':>11} {'per slot':>9} {'scan ms':>9} {'per slot':>9}")
+    for slots in args.slots:
+        indexed = time_creation(slots, create_regions, args.repeat)
+        scan = time_creation(slots, scan_create_regions, args.repeat)
+        print(f"{slots:>6} {indexed * 1000:>11.2f} {indexed * 1000 / slots:>9.3f} "
+              f"{scan * 1000:>9.2f} {scan * 1000 / slots:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
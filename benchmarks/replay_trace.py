@@ -0,0 +1,56 @@
+"""
+Replays a RAM trace recorded with /trace through the Crash2Client handlers as fast as possible.
+
+Every frame is loaded into a FakeBizHawk connector before one game_watcher tick, so the client runs exactly as it did
+live. The location checks found on each frame are printed, which makes the output diffable between client versions.
+
+Run from an Archipelago checkout with the world installed as worlds/crash2:
+    PYTHONPATH=. python <path>/benchmarks/replay_trace.py session.c2rt
+"""
+import argparse
+import asyncio
+import time
+
+
+async def replay(path: str, quiet: bool) -> None:
+    from worlds._bizhawk.context import BizHawkClientContext
+    from worlds.crash2.ClientShim import Crash2Client
+    from worlds.crash2.test.fake_bizhawk import FakeBizHawk, setup_offline_slot
+    from worlds.crash2.RamTrace import RamTraceReader
+
+    reader = RamTraceReader(path)
+    fake = FakeBizHawk(reader.game_id)
+    ctx = BizHawkClientContext(None, None)
+    await fake.connect(ctx.bizhawk_ctx)
+    client = Crash2Client()
+    if not await client.validate_rom(ctx):
+        raise RuntimeError("validate_rom rejected the fake connector")
+    setup_offline_slot(ctx)
+
+    frames = 0
+    start = time.perf_counter()
+    for frame in reader.frames():
+        fake.load_snapshot(frame.snapshot)
+        sent = len(ctx.sent_checks)
+        await client.game_watcher(ctx)
+        if not quiet and len(ctx.sent_checks) > sent:
+            print(f"{frame.tick:>8} {frame.timestamp:>10.3f}s {sorted(ctx.sent_checks[sent:])}")
+        frames += 1
+    elapsed = time.perf_counter() - start
+
+    reader.close()
+    await fake.stop()
+    print(f"replayed {frames} frames in {elapsed:.3f} s ({frames / max(elapsed, 1e-9):.1f} frames/s), "
+          f"{len(ctx.sent_checks)} locations checked")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("trace")
+    parser.add_argument("--quiet", action="store_true", help="only print the summary")
+    args = parser.parse_args()
+    asyncio.run(replay(args.trace, args.quiet))
+
+
+if __name__ == "__main__":
+    main()
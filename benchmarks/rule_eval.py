@@ -0,0 +1,90 @@
+"""
+Access rule evaluation cost, as paid during fill and spoiler sweeps.
+
+"compiled" are the rules set_rules installs (Rules.compile_rules), integer comparisons against the floor count and
+color gem mask Crash2World.collect keeps in the state. "closures" rebuilds the rules the way they used to be
+written: one closure per rule computing base_value * k, and a chain of five state.has calls for Stage25. Every
+rule is evaluated against states holding none, some and all of the progression items.
+
+Run from an Archipelago checkout with the world installed as worlds/crash2:
+    PYTHONPATH=. python <path>/benchmarks/rule_eval.py --rounds 200000
+"""
+import argparse
+import time
+from collections import Counter
+from typing import Callable, Dict, List
+
+PLAYER = 1
+
+
+def closure_rules(use_progress_items: int) -> Dict[str, Callable]:
+    from worlds.crash2.Rules import FLOOR_ENTRANCES, FLOOR_LOCATIONS, GEM_LOCATIONS, floor_item
+
+    item_name, base_value = floor_item(use_progress_items)
+    player = PLAYER
+    rules: Dict[str, Callable] = {}
+    for name, floors in {**FLOOR_ENTRANCES, **FLOOR_LOCATIONS}.items():
+        rules[name] = lambda state, k=floors: state.has(item_name, player, count=base_value * k)
+    for name, gems in GEM_LOCATIONS.items():
+        if len(gems) == 1:
+            rules[name] = lambda state, gem=gems[0]: state.has(gem, player)
+        else:
+            rules[name] = lambda state: state.has("Green Gem", player) \
+                and state.has("Red Gem", player) \
+                and state.has("Blue Gem", player) \
+                and state.has("Purple Gem", player) \
+                and state.has("Yellow Gem", player)
+    return rules
+
+
+def make_states(use_progress_items: int) -> List:
+    from BaseClasses import CollectionState
+    from worlds.crash2.Rules import floor_item, update_progress
+
+    item_name, base_value = floor_item(use_progress_items)
+    gems = ["Red Gem", "Blue Gem", "Yellow Gem", "Green Gem", "Purple Gem"]
+    states = []
+    for floors, gem_count in ((0, 0), (2, 2), (3, 4), (5, 5)):
+        # Only prog_items is used by the rules, so skip building a whole multiworld
+        state = CollectionState.__new__(CollectionState)
+        state.prog_items = {PLAYER: Counter({item_name: base_value * floors, **{gem: 1 for gem in gems[:gem_count]}})}
+        # What Crash2World.collect derives from these items
+        for name in [item_name, *gems]:
+            update_progress(state, PLAYER, name, item_name, base_value)
+        states.append(state)
+    return states
+
+
+def time_rules(rules: Dict[str, Callable], states: List, rounds: int) -> float:
+    rule_list = list(rules.values())
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for state in states:
+            for rule in rule_list:
+                rule(state)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    from worlds.crash2.Rules import compile_rules
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=200000)
+    args = parser.parse_args()
+
+    for use_progress_items, label in ((0, "progressive floor"), (1, "vanilla power stones")):
+        states = make_states(use_progress_items)
+        compiled = compile_rules(PLAYER)
+        closures = closure_rules(use_progress_items)
+        for state in states:
+            assert [rule(state) for rule in compiled.values()] == [closures[name](state) for name in compiled]
+        evaluations = args.rounds * len(states) * len(compiled)
+        compiled_s = time_rules(compiled, states, args.rounds)
+        closures_s = time_rules(closures, states, args.rounds)
+        print(f"{label}: {evaluations} evaluations")
+        print(f"  closures: {closures_s * 1e9 / evaluations:7.1f} ns/rule")
+        print(f"  compiled: {compiled_s * 1e9 / evaluations:7.1f} ns/rule ({closures_s / compiled_s:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
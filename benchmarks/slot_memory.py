@@ -0,0 +1,102 @@
+"""
+Memory held per Crash 2 slot by its regions, locations and item pool.
+
+Each slot's regions and item pool are built the way generation builds them, and tracemalloc measures what stays
+allocated. Crash2Item and Crash2Location are then compared with plain subclasses of Item and Location; Crash2Item
+declares empty __slots__ so it keeps Item's slotted layout instead of adding a __dict__.
+
+Run from an Archipelago checkout with the world installed as worlds/crash2:
+    PYTHONPATH=. python <path>/benchmarks/slot_memory.py --slots 50
+"""
+import argparse
+import gc
+import tracemalloc
+from typing import Callable, List, Tuple
+
+
+def build_multiworld(slots: int):
+    from BaseClasses import MultiWorld
+    from worlds.crash2 import Crash2World
+    from worlds.crash2.Options import Crash2Options
+
+    multiworld = MultiWorld(slots)
+    multiworld.set_seed(0)
+    for player in range(1, slots + 1):
+        multiworld.game[player] = Crash2World.game
+        multiworld.player_name[player] = f"Player{player}"
+        world = Crash2World(multiworld, player)
+        world.options = Crash2Options(**{name: option.from_any(option.default)
+                                         for name, option in Crash2Options.type_hints.items()})
+        multiworld.worlds[player] = world
+    return multiworld
+
+
+def measure(build: Callable[[], object]) -> Tuple[int, object]:
+    """Bytes still allocated by build() once it returns, and its result."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+
+def build_slots(multiworld) -> List:
+    from worlds.crash2.Items import create_itempool
+    from worlds.crash2.Regions import create_regions
+
+    pools = []
+    for world in multiworld.worlds.values():
+        create_regions(world)
+        pools.append(create_itempool(world))
+    return pools
+
+
+def object_bytes(location_cls, item_cls, slots: int, pool_names: List[str]) -> Tuple[float, float]:
+    """Bytes per location, with an item placed in it, and per item."""
+    from worlds.crash2.Items import item_table
+    from worlds.crash2.Locations import location_table
+
+    item_bytes, items = measure(lambda: [item_cls(name, item_table[name].classification, item_table[name].ap_code, player)
+                                         for player in range(1, slots + 1) for name in pool_names])
+
+    def build_locations():
+        locations = [location_cls(player, name, data.ap_code, None)
+                     for player in range(1, slots + 1) for name, data in location_table.items()]
+        for location, item in zip(locations, items):
+            location.item = item
+        return locations
+
+    location_bytes, locations = measure(build_locations)
+    return location_bytes / len(locations), item_bytes / len(items)
+
+
+def main() -> None:
+    from BaseClasses import Item, Location
+    from worlds.crash2.Items import Crash2Item
+    from worlds.crash2.Regions import Crash2Location
+
+    class PlainItem(Item):
+        game = Crash2Item.game
+
+    class PlainLocation(Location):
+        game = Crash2Location.game
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--slots", type=int, default=50)
+    args = parser.parse_args()
+
+    multiworld = build_multiworld(args.slots)
+    slot_bytes, pools = measure(lambda: build_slots(multiworld))
+    pool_names = [item.name for item in pools[0]]
+    print(f"slots:          {args.slots}, {len(pool_names)} items each")
+    print(f"per slot:       {slot_bytes / args.slots / 1024:.1f} KiB (regions, locations, entrances, item pool)")
+    for label, location_cls, item_cls in (("crash2", Crash2Location, Crash2Item), ("plain", PlainLocation, PlainItem)):
+        location_bytes, item_bytes = object_bytes(location_cls, item_cls, args.slots, pool_names)
+        print(f"{label + ':':<15} {location_bytes:.0f} B per filled location, {item_bytes:.0f} B per item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Import-time cost of the location tables.
+
+"derived" redoes the work importing the world used to do: parsing every stage name in gen_stage_locations, building
+Crash2Addresses.LOCATIONS, and the location_name_groups loop over one region per location, rescanning the whole
+table each time. "generated" loads StaticData, the tables GenStaticData.py writes, the way an import does from its
+.pyc (unmarshal and exec) and builds the same objects from it as Locations, Crash2Addresses and Crash2World do.
+Finding and reading the module file is left out of both; benchmarks/world_import.py measures whole imports.
+
+Run from an Archipelago checkout with the world installed as worlds/crash2:
+    PYTHONPATH=. python <path>/benchmarks/static_data.py --repeat 500
+"""
+import argparse
+import marshal
+import statistics
+import time
+from typing import Callable, List
+
+
+def derive_tables() -> None:
+    from worlds.crash2 import GenStaticData
+    from worlds.crash2.Locations import LocData
+
+    stage_locations = {name: LocData(*record)
+                       for name, record in GenStaticData.gen_stage_locations(GenStaticData.stage_dict).items()}
+    location_table = {**stage_locations, **{name: LocData(*record) for name, record in GenStaticData.boss_locations.items()}}
+    [{"name": name, "Id": data.ap_code, "Address": data.addr, "CheckType": 0, "AddressBit": data.bit}
+     for name, data in location_table.items()]
+    location_name_groups = {}
+    for region in [data.region for data in location_table.values()]:
+        location_name_groups[region] = set(name for name, data in location_table.items() if data.region == region)
+
+
+def static_data_loader() -> Callable[[], None]:
+    from worlds.crash2 import StaticData
+    from worlds.crash2.Locations import LocData
+
+    with open(StaticData.__file__) as file:
+        code = marshal.dumps(compile(file.read(), StaticData.__file__, "exec"))
+
+    def load_tables() -> None:
+        tables: dict = {}
+        exec(marshal.loads(code), tables)
+        {name: LocData(*record) for name, record in {**tables["STAGE_LOCATIONS"], **tables["BOSS_LOCATIONS"]}.items()}
+        [{"name": name, "Id": tables["LOCATION_NAME_TO_ID"][name], "Address": address, "CheckType": 0, "AddressBit": bit}
+         for name, (address, bit) in tables["LOCATION_FLAGS"].items()]
+        {region: set(names) for region, names in tables["REGION_LOCATIONS"].items()}
+    return load_tables
+
+
+def time_median(run: Callable[[], None], repeat: int) -> float:
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    derived = time_median(derive_tables, args.repeat)
+    generated = time_median(static_data_loader(), args.repeat)
+    print(f"derived:   {derived * 1e6:8.1f} us (median of {args.repeat})")
+    print(f"generated: {generated * 1e6:8.1f} us ({derived / generated:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
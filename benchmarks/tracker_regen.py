@@ -0,0 +1,61 @@
+"""
+Cost of a Universal Tracker regeneration of one Crash 2 slot.
+
+"generation" runs the world steps of a normal generation: generate_early, create_regions, create_items and
+set_rules. "tracker" runs the same steps with the slot data in multiworld.re_gen_passthrough, as the tracker does:
+the options come from the slot data and no item pool or filler is rolled.
+
+Run from an Archipelago checkout with the world installed as worlds/crash2:
+    PYTHONPATH=. python <path>/benchmarks/tracker_regen.py --repeat 200
+"""
+import argparse
+import statistics
+import time
+from typing import Any, Dict, List, Optional
+
+STEPS = ("generate_early", "create_regions", "create_items", "set_rules")
+
+
+def build_multiworld(slot_data: Optional[Dict[str, Any]]):
+    from BaseClasses import MultiWorld
+    from worlds.crash2 import Crash2World
+    from worlds.crash2.Options import Crash2Options
+
+    multiworld = MultiWorld(1)
+    multiworld.set_seed(0)
+    multiworld.game[1] = Crash2World.game
+    multiworld.player_name[1] = "Player1"
+    world = Crash2World(multiworld, 1)
+    world.options = Crash2Options(**{name: option.from_any(option.default)
+                                     for name, option in Crash2Options.type_hints.items()})
+    multiworld.worlds[1] = world
+    if slot_data is not None:
+        multiworld.re_gen_passthrough = {Crash2World.game: slot_data}
+    return multiworld
+
+
+def regenerate(slot_data: Optional[Dict[str, Any]]) -> float:
+    multiworld = build_multiworld(slot_data)
+    world = multiworld.worlds[1]
+    start = time.perf_counter()
+    for step in STEPS:
+        getattr(world, step)()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    slot_data = {"options": {"DummyOption": 1, "UseProgressItemInsteadOfPowerStones": 1}}
+    tracker: List[float] = [regenerate(slot_data) for _ in range(args.repeat)]
+    generation: List[float] = [regenerate(None) for _ in range(args.repeat)]
+    tracker_ms = statistics.median(tracker) * 1000
+    generation_ms = statistics.median(generation) * 1000
+    print(f"generation:      {generation_ms:.3f} ms (median of {args.repeat})")
+    print(f"tracker:         {tracker_ms:.3f} ms ({generation_ms / tracker_ms:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
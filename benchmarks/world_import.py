@@ -0,0 +1,72 @@
+"""
+Import cost of the crash2 world.
+
+Each run is a fresh interpreter with -X importtime. "world" is the cumulative time of worlds.crash2, which includes
+"registration", the cumulative time of worlds.crash2.ClientShim. "watcher" is the cumulative time of
+worlds.crash2.Client, which a client only imports on its first validate_rom and which Generate and MultiServer never
+import. In a full install `import worlds` loads every world first, so the modules shared with other worlds
+(worlds._bizhawk) may already be loaded there and are not counted.
+
+Run from an Archipelago checkout with the world installed as worlds/crash2:
+    PYTHONPATH=. python <path>/benchmarks/world_import.py --runs 10
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+PROBE = """
+import sys
+import worlds.crash2
+loaded = sorted(name for name in sys.modules if name.startswith("worlds.crash2."))
+print("LOADED " + ",".join(loaded))
+import worlds.crash2.Client
+"""
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """module -> cumulative import time in microseconds"""
+    cumulative: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = line[len("import time:"):].split("|")
+        if total.strip().isdigit():
+            cumulative[name.strip()] = int(total)
+    return cumulative
+
+
+def measure() -> Tuple[int, int, int, List[str]]:
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", PROBE], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr[-2000:])
+    cumulative = parse_importtime(result.stderr)
+    loaded = next(line for line in result.stdout.splitlines() if line.startswith("LOADED "))[len("LOADED "):]
+    return (cumulative.get("worlds.crash2", 0), cumulative.get("worlds.crash2.ClientShim", 0),
+            cumulative.get("worlds.crash2.Client", 0), loaded.split(","))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    world: List[int] = []
+    registration: List[int] = []
+    watcher: List[int] = []
+    loaded: List[str] = []
+    for _ in range(args.runs):
+        world_us, registration_us, watcher_us, loaded = measure()
+        world.append(world_us)
+        registration.append(registration_us)
+        watcher.append(watcher_us)
+
+    print(f"world import:          {statistics.median(world) / 1000:.2f} ms (median of {args.runs})")
+    print(f"of which registration: {statistics.median(registration) / 1000:.2f} ms")
+    print(f"watcher, deferred:     {statistics.median(watcher) / 1000:.2f} ms")
+    print(f"modules after import:  {', '.join(loaded)}")
+
+
+if __name__ == "__main__":
+    main()
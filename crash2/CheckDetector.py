@@ -0,0 +1,102 @@
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from .Crash2Addresses import CHECK_TYPE, CHECK_TYPE_SIZE, COMPARE_TYPE
+from .MemoryWatch import MemorySnapshot
+
+
+class BitCheck(NamedTuple):
+    mask: int
+    expected: int  # mask for CHECK_TYPE.bit, 0 for CHECK_TYPE.falseBit
+    ap_code: int
+
+
+class ValueCheck(NamedTuple):
+    ap_code: int
+    address: int
+    check_type: int
+    value: int
+    compare_type: int
+
+    def read(self, snapshot: MemorySnapshot) -> int:
+        raw = snapshot.block(self.address, CHECK_TYPE_SIZE[self.check_type])
+        if self.check_type == CHECK_TYPE.nibble:
+            return raw[0] & 0x0F
+        return int.from_bytes(raw, byteorder='little', signed=(self.check_type == CHECK_TYPE.int))
+
+    def is_checked(self, snapshot: MemorySnapshot) -> bool:
+        value = self.read(snapshot)
+        if self.compare_type == COMPARE_TYPE.GreaterThan:
+            return value > self.value
+        elif self.compare_type == COMPARE_TYPE.LessThan:
+            return value < self.value
+        return value == self.value
+
+
+def changed_addresses(previous: MemorySnapshot, current: MemorySnapshot) -> Iterator[int]:
+    """Yields every byte address whose value differs between two snapshots of the same registry."""
+    for (start, _), old, new in zip(current.ranges, previous.blocks, current.blocks):
+        if old == new:
+            continue
+        diff = int.from_bytes(old, byteorder='little') ^ int.from_bytes(new, byteorder='little')
+        while diff:
+            offset = ((diff & -diff).bit_length() - 1) >> 3
+            yield start + offset
+            diff &= ~(0xFF << (offset * 8))
+
+
+class LocationCheckIndex:
+    """Precompiled address -> check index, so detection cost follows the number of flipped bits."""
+
+    def __init__(self, locations: Iterable[dict]):
+        self.locations = list(locations)
+        self.bits: Dict[int, List[BitCheck]] = {}
+        self.values: Dict[int, List[ValueCheck]] = {}
+        for location in self.locations:
+            check_type = location["CheckType"]
+            if check_type in (CHECK_TYPE.bit, CHECK_TYPE.falseBit):
+                mask = 1 << location["AddressBit"]
+                expected = mask if check_type == CHECK_TYPE.bit else 0
+                self.bits.setdefault(location["Address"], []).append(BitCheck(mask, expected, location["Id"]))
+            else:
+                check = ValueCheck(location["Id"], location["Address"], check_type,
+                                   int(location["CheckValue"], 0),
+                                   location.get("CompareType", COMPARE_TYPE.Match))
+                # Register on every byte the value spans so a change to any of them re-evaluates it
+                for offset in range(CHECK_TYPE_SIZE[check_type]):
+                    self.values.setdefault(location["Address"] + offset, []).append(check)
+
+    def subset(self, ap_codes: Iterable[int]) -> "LocationCheckIndex":
+        """Index over only the given locations."""
+        ap_codes = set(ap_codes)
+        return LocationCheckIndex(location for location in self.locations if location["Id"] in ap_codes)
+
+    def scan(self, snapshot: MemorySnapshot) -> Set[int]:
+        """Evaluates every location of the index against the snapshot."""
+        found: Set[int] = set()
+        for address, checks in self.bits.items():
+            value = snapshot.read8(address)
+            found.update(check.ap_code for check in checks if value & check.mask == check.expected)
+        for checks in self.values.values():
+            found.update(check.ap_code for check in checks if check.is_checked(snapshot))
+        return found
+
+    def diff(self, previous: Optional[MemorySnapshot], current: MemorySnapshot) -> Set[int]:
+        """Locations that became checked between two snapshots."""
+        if previous is None or previous.ranges != current.ranges:
+            return self.scan(current)
+
+        found: Set[int] = set()
+        evaluated: Set[Tuple[int, int]] = set()
+        for address in changed_addresses(previous, current):
+            old, new = previous.read8(address), current.read8(address)
+            flipped = old ^ new
+            for check in self.bits.get(address, ()):
+                if flipped & check.mask and new & check.mask == check.expected:
+                    found.add(check.ap_code)
+            for check in self.values.get(address, ()):
+                if (check.ap_code, check.address) in evaluated:
+                    continue
+                evaluated.add((check.ap_code, check.address))
+                if check.is_checked(current) and not check.is_checked(previous):
+                    found.add(check.ap_code)
+        return found
@@ -0,0 +1,101 @@
+import json
+import logging
+import os
+import re
+import time
+from typing import Callable, Iterable, Optional, Set, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from worlds._bizhawk.context import BizHawkClientContext
+logger = logging.getLogger("Client")
+
+
+def slot_file_name(seed: str, slot: str, suffix: str) -> str:
+    """File name keyed by seed and slot, safe for any slot name."""
+    return re.sub(r"[^\w.-]", "_", f"{seed}_{slot}") + suffix
+
+
+def is_server_connected(ctx: "BizHawkClientContext") -> bool:
+    # Same test CommonContext.send_msgs uses before dropping a message
+    return bool(ctx.server and ctx.server.socket.open and not ctx.server.socket.closed)
+
+
+class CheckOutbox:
+    """
+    Location checks waiting for the server.
+
+    Checks found within `window` seconds are sent as one LocationChecks message. They stay pending, and on disk,
+    until the server reports them in checked_locations, so a dropped connection does not lose them.
+    """
+
+    def __init__(self, path: Optional[str] = None, window: float = 0.25, resend_after: float = 5.0,
+                 connected: Callable[["BizHawkClientContext"], bool] = is_server_connected):
+        self.path = path
+        self.connected = connected
+        self.window = window
+        self.resend_after = resend_after
+        self.pending: Set[int] = set()
+        self.first_pending_at: Optional[float] = None
+        self.sent_at: Optional[float] = None
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r") as file:
+                    self.pending = set(json.load(file))
+                self.first_pending_at = time.monotonic()
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not load pending location checks from {path}: {e}")
+
+    def _persist(self) -> None:
+        if not self.path:
+            return
+        try:
+            if self.pending:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with open(self.path, "w") as file:
+                    json.dump(sorted(self.pending), file)
+            elif os.path.exists(self.path):
+                os.remove(self.path)
+        except OSError as e:
+            logger.warning(f"Could not save pending location checks to {self.path}: {e}")
+
+    def add(self, ap_codes: Iterable[int], now: Optional[float] = None) -> None:
+        new = set(ap_codes) - self.pending
+        if not new:
+            return
+        if not self.pending:
+            self.first_pending_at = time.monotonic() if now is None else now
+        self.pending |= new
+        self.sent_at = None
+        self._persist()
+
+    def time_left(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the pending checks are due, None when nothing is waiting to be sent."""
+        if not self.pending or self.sent_at is not None:
+            return None
+        now = time.monotonic() if now is None else now
+        return max(0.0, self.window - (now - self.first_pending_at))
+
+    def confirm(self, checked_locations: Iterable[int]) -> None:
+        """Drops everything the server already knows about."""
+        if self.pending and not self.pending.isdisjoint(checked_locations):
+            self.pending.difference_update(checked_locations)
+            if not self.pending:
+                self.first_pending_at = None
+                self.sent_at = None
+            self._persist()
+
+    async def flush(self, ctx: "BizHawkClientContext", force: bool = False) -> bool:
+        """Sends the pending checks if they are due, or right away with force. Returns True when a message was sent."""
+        self.confirm(ctx.checked_locations)
+        if not self.pending or not self.connected(ctx):
+            return False
+        now = time.monotonic()
+        if not force:
+            if self.sent_at is not None:
+                if now - self.sent_at < self.resend_after:
+                    return False
+            elif now - self.first_pending_at < self.window:
+                return False
+        await ctx.send_msgs([{"cmd": "LocationChecks", "locations": sorted(self.pending)}])
+        self.sent_at = now
+        return True
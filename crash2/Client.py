@@ -1,7 +1,8 @@
 # Common import
-from typing import Optional, Dict
+from typing import Dict, FrozenSet
 import asyncio
 import multiprocessing
+import time
 import traceback
 import Utils
 import logging
@@ -11,118 +12,170 @@ logger = logging.getLogger("Client")
 from typing import TYPE_CHECKING
 from NetUtils import ClientStatus
 import worlds._bizhawk as bizhawk
-from worlds._bizhawk.client import BizHawkClient
 if TYPE_CHECKING:
     from worlds._bizhawk.context import BizHawkClientContext, BizHawkClientCommandProcessor
 
 # Game title dedicated
-from . import Locations, Items
-from .Options import GAME_TITLE, GAME_TITLE_FULL
-from .Crash2Addresses import LOCATIONS, CHECK_TYPE, COMPARE_TYPE, ADDRESSES, LEVEL
+from .Options import GAME_TITLE
+from .Index import location_index
+from .Crash2Addresses import LOCATIONS, CHECK_TYPE_SIZE, ADDRESSES, DEFAULT_GAME_ID, LEVEL
+from .MemoryLayout import LAYOUT_BY_ID, ID_WINDOW, MemoryLayout, detect_layout
+from .MemoryWatch import MemoryWatchRegistry
+from .CheckDetector import LocationCheckIndex
+from .LevelStates import CheckPlanner, LEVEL_CHECKS, TRUSTED_LEVELS
+from .MemoryWriter import ShadowMemory
+from .PollScheduler import PollPolicy, PollScheduler
+from .ItemEffects import ItemCounters
+from .ClientPerf import ClientPerf
+from .RamTrace import RamTraceWriter
+from .CheckOutbox import CheckOutbox, slot_file_name
+from .ClientCache import ClientStateCache, items_digest, update_items_digest, snapshot_from_dict, snapshot_to_dict
 CLIENT_INIT_LOG=f"{GAME_TITLE} Client"
 CLIENT_VERSION="v0.1.0"
+CHECK_INDEXES = {game_id: LocationCheckIndex(layout.locations()) for game_id, layout in LAYOUT_BY_ID.items()}
+RESUME_WAIT = 2.0 # seconds to wait for the server's items before dropping the client cache
+
+# Byte offsets in the PowerStoneFlags field
+# Power stone location flags, in a fixed order so each byte keeps its power_stone_wait_counter slot
+POWER_STONE_LOCATION_BYTES = tuple(sorted(set(loc["Address"] - ADDRESSES[DEFAULT_GAME_ID]["PowerStoneFlags"]
+                                              for loc in LOCATIONS if "Power Stone" in loc["name"])))
+# Unused power stone bytes which hold the received power stone count
+DUMMY_POWER_STONE_BYTES = (0, 5, 6, 7)
+POWER_STONE_BYTE_VALUES = (0x00, 0x01, 0x03, 0x07, 0x0f, 0x1f, 0x3f, 0x7f, 0xff)
+# Byte offset of the color gem flags in the GemFlags field
+COLOR_GEM_BYTE = 7
+
+def color_gem_levels(location: str, found_in: int) -> FrozenSet[int]:
+    """The level a gem is found in and those the CheckPlanner evaluates its location after."""
+    ap_code = location_index.code(location)
+    return frozenset([found_in, *(level for level, ap_codes in LEVEL_CHECKS.items() if ap_code in ap_codes)])
+
+# (item counter, location, level the gem is found in, bit)
+COLOR_GEMS = (
+    ("red_gem", "Stage02: Red Gem(from Stage07)", LEVEL.Stage02, 0x04),
+    ("green_gem", "Stage10: Green Gem", LEVEL.Stage10, 0x08),
+    ("purple_gem", "Stage20: Purple Gem", LEVEL.Stage20, 0x10),
+    ("blue_gem", "Stage01: Blue Gem(Not break boxes)", LEVEL.Stage01, 0x20),
+    ("yellow_gem", "Stage11: Yellow Gem(time trial)", LEVEL.Stage11, 0x40),
+)
+# (item counter, levels the game sets the gem's bit in, bit)
+# A received gem's bit is not forced in those levels, or the return to the warp room would report it as found
+COLOR_GEM_BITS = tuple((counter, color_gem_levels(location, level), bit) for counter, location, level, bit in COLOR_GEMS)
+# (item counter, location code)
+COLOR_GEM_CODES = tuple((counter, location_index.code(location)) for counter, location, _, _ in COLOR_GEMS)
+
+
+def cmd_perf(self: "BizHawkClientCommandProcessor", option: str = ""):
+    """Show game watcher timings and BizHawk traffic. "/perf reset" clears them."""
+    perf = getattr(self.ctx, "perf", None)
+    if perf is None:
+        logger.info("No performance data yet. Connect to the game first.")
+        return
+    if option == "reset":
+        perf.reset()
+        logger.info("Performance counters reset.")
+        return
+    logger.info(perf.report())
 
-
-def CommandProcessor(self: "BizHawkClientCommandProcessor"):
-    # This is not mandatory for the game. Just a client command implementation.
-    # def _cmd_kill(self):
-    #     """Kill the game."""
-    #     if isinstance(self.ctx, Crash2Context):
-    #         self.ctx.game_interface.kill_player()
-    pass
-
-
-class Crash2Client(BizHawkClient):
-    game = f"{GAME_TITLE_FULL}"
-    system = "PSX"
-    patch_suffix = ".apcrash2"
-
-    # Client variables
-    command_processor = CommandProcessor
-    slot_data: Optional[dict[str, Utils.Any]] = None
-    last_error_message: Optional[str] = None
-    notification_queue: list[str] = []
-    notification_timestamp: float = 0
-    showing_notification: bool = False
-    deathlink_timestamp: float = 0
-    death_link_enabled = False
-    queued_deaths: int = 0
-    items_handling = 0b111 # This is mandatory
-    location_table = []
-    # For Bizhawk client
-    server = None
-    server_address = None
-    connect_address = None
-    _messagebox_connection_loss = False
-    disconnected_intentionally = False
-    current_reconnect_delay = 0
-    autoreconnect_task = None
-    max_size = 10_000_000  # 適当なバッファサイズでOK
-    def handle_connection_loss(self, message: str): logger.warning(f"Connection lost: {message}")
-    async def connection_closed(self): pass
-    def cancel_autoreconnect(self): pass
-
-
-    async def validate_rom(self, ctx: "BizHawkClientContext") -> bool:
-        try:
-            # Check ROM name/patch version
-            rom_name = ((await bizhawk.read(ctx.bizhawk_ctx, [(ADDRESSES["SCPS-10047"]["GAME_ID"], 10, "MainRAM")]))[0]).decode("ascii")
-            if rom_name != "SCPS-10047":
-                return False  # Not a MYGAME ROM
-        except bizhawk.RequestFailedError:
-            return False  # Not able to get a response, say no for now
-
-        # This is a MYGAME ROM
-        ctx.game = self.game
-        ctx.items_handling = 0b111
-        ctx.want_slot_data = True
-        ctx.game_id = rom_name
-
-        # initialize variables
-        await init_function(ctx)
-        
-        return True
-
-    async def game_watcher(self, ctx: "BizHawkClientContext") -> None:
-        try:
-            if ctx.slot_data is not None:
+def cmd_resync(self: "BizHawkClientCommandProcessor"):
+    """Evaluate every location again on the next warp room visit."""
+    if getattr(self.ctx, "check_planner", None) is None:
+        logger.info("Connect to the game first.")
+        return
+    self.ctx.check_baseline = None
+    self.ctx.catch_up_pending = True
+    logger.info("Every location will be checked again in the warp room.")
+
+def cmd_trace(self: "BizHawkClientCommandProcessor", path: str = ""):
+    """Record the watched RAM to a trace file. "/trace <file>" starts recording, "/trace" stops it."""
+    if not start_ram_trace(self.ctx, path) and path:
+        logger.info("Connect to the game before starting a trace.")
+
+
+async def validate_rom(client, ctx: "BizHawkClientContext") -> bool:
+    try:
+        # Check ROM name/patch version. One read covers the ID of every known version
+        layout = detect_layout((await bizhawk.read(ctx.bizhawk_ctx, [(*ID_WINDOW, "MainRAM")]))[0])
+        if layout is None:
+            return False  # Not a MYGAME ROM
+    except bizhawk.RequestFailedError:
+        return False  # Not able to get a response, say no for now
+
+    # This is a MYGAME ROM
+    ctx.game = client.game
+    ctx.items_handling = 0b111
+    ctx.want_slot_data = True
+    ctx.game_id = layout.game_id
+    ctx.memory_layout = layout
+
+    # initialize variables
+    await init_function(ctx)
+    if "perf" not in ctx.command_processor.commands:
+        ctx.command_processor.commands["perf"] = cmd_perf
+    if "resync" not in ctx.command_processor.commands:
+        ctx.command_processor.commands["resync"] = cmd_resync
+    if "trace" not in ctx.command_processor.commands:
+        ctx.command_processor.commands["trace"] = cmd_trace
+    
+    return True
+
+async def game_watcher(ctx: "BizHawkClientContext") -> None:
+    try:
+        if ctx.slot_data is not None:
+            perf = ctx.perf
+            with perf.tick():
+                # Read every watched memory window at once
+                previous = ctx.previous_snapshot = ctx.snapshot
+                with perf.phase("read"):
+                    ctx.snapshot = await ctx.memory_watch.read(ctx)
+                perf.record_read(ctx.memory_watch.size)
+                if ctx.ram_trace is not None:
+                    ctx.ram_trace.record(ctx.snapshot)
+                processed_item_count = ctx.processed_item_count
                 # Check recieved items
-                await handle_received_items(ctx)
+                with perf.phase("handle_received_items"):
+                    await handle_received_items(ctx)
                 # Check archieved locations
-                await handle_checked_locations(ctx)
+                with perf.phase("handle_checked_locations"):
+                    await handle_checked_locations(ctx)
                 # Check goal is checked or not
-                await handle_check_goal(ctx)
+                with perf.phase("handle_check_goal"):
+                    await handle_check_goal(ctx)
                 # Check and Modify in game memory for randomizer
-                await handle_memory_update(ctx)
-
-        except bizhawk.RequestFailedError:
-            # The connector didn't respond. Exit handler and return to main loop to reconnect
-            pass
-
-
-    def notification(self, text: str):
-        self.notification_queue.append(text)
-
-    def make_gui(self):
-        ui = super().make_gui()
-        ui.base_title = f"{GAME_TITLE} Client v{CLIENT_VERSION}"
-        if tracker_loaded:
-            ui.base_title += f" | Universal Tracker {UT_VERSION}"
-
-        # AP version is added behind this automatically
-        ui.base_title += " | Archipelago"
-        return ui
+                with perf.phase("memory_update"):
+                    await handle_memory_update(ctx)
+                # Poll fast while something happens, back off while idle
+                active = previous is None or previous.blocks != ctx.snapshot.blocks \
+                    or processed_item_count != ctx.processed_item_count
+                ctx.watcher_timeout = ctx.poll_scheduler.update(get_current_level(ctx), active)
+                # Come back in time to send checks waiting in the outbox
+                time_left = ctx.check_outbox.time_left()
+                if time_left is not None:
+                    ctx.watcher_timeout = min(ctx.watcher_timeout, max(time_left, 0.01))
+            save_client_state(ctx)
+            dump = perf.dump_due()
+            if dump is not None:
+                logger.info(f"perf {dump}")
+
+    except bizhawk.RequestFailedError:
+        # The connector didn't respond. Exit handler and return to main loop to reconnect
+        pass
 
-    def on_package(self, ctx, cmd: str, args: dict):
-        super().on_package(ctx, cmd, args)
-        if cmd == "Connected":
-            logger.info(f"================================================\n"
-                        f"    -- Connected to Bizhawk successfully! --    \n"
-                        f"      Archipelago Crash2 version {CLIENT_VERSION}\n"
-                        f"================================================\n")
-            ctx.slot_data = args["slot_data"]
-            # logger.info(f"Received data: {args}")
-            ctx.location_table = ctx.server_locations # list
+def on_connected(ctx, args: dict):
+    logger.info(f"================================================\n"
+                f"    -- Connected to Bizhawk successfully! --    \n"
+                f"      Archipelago Crash2 version {CLIENT_VERSION}\n"
+                f"================================================\n")
+    ctx.slot_data = args["slot_data"]
+    # logger.info(f"Received data: {args}")
+    ctx.location_table = ctx.server_locations # list
+    # Rescan every location flag on (re)connect, unless the cached state can be resumed
+    ctx.check_baseline = None
+    ctx.catch_up_pending = True
+    init_slot_state(ctx)
+    # Send the checks the previous connection could not deliver
+    ctx.check_outbox.add(ap_code for ap_code in ctx.locations_checked if ap_code not in ctx.checked_locations)
+    Utils.async_start(ctx.check_outbox.flush(ctx, force=True), name="Crash2 flush check outbox")
 
 
 ############################################
@@ -133,18 +186,14 @@ async def handle_received_items(ctx: 'Context') -> None:
     if ctx.slot_data is None:
         return
 
-    # 初回だけ記録用に items_received の長さを記憶しておく
-    if not hasattr(ctx, "processed_item_count"):
-        ctx.processed_item_count = -1
-        new_items = ctx.items_received[0:]
-    else:
-        new_items = ctx.items_received[ctx.processed_item_count:]
+    if ctx.resume_state is not None and not resume_client_state(ctx):
+        return  # wait for the items the client cache covers
 
-    for index, item in enumerate(new_items):
-        item_id = item.item
-        await item_received(ctx, item_id, ctx.processed_item_count)
-        # logger.info(f"Received item: ({item_id})")
-        
+    # Apply every item received since the last tick in one batch
+    new_items = ctx.items_received[ctx.processed_item_count:]
+    if new_items:
+        ctx.item_counters.apply(item.item for item in new_items)
+        update_items_digest(ctx.items_digest, new_items)
     ctx.processed_item_count = len(ctx.items_received)
 
 
@@ -154,16 +203,14 @@ async def handle_checked_locations(ctx: 'Context') -> None:
         return
 
     # logger.info(f"{ctx.location_table}")
-    new_checks = []
-    for ap_code in ctx.location_table:
-        if ap_code in ctx.checked_locations:
-            continue
-        if await is_location_checked(ctx, ap_code) is True:
-            new_checks.append(ap_code)
+    new_checks = [ap_code for ap_code in get_new_checks(ctx)
+                  if ap_code in ctx.location_table and ap_code not in ctx.checked_locations]
 
     if new_checks:
-        await ctx.send_msgs([{"cmd": 'LocationChecks', "locations": new_checks}])
+        ctx.check_outbox.add(new_checks)
         ctx.locations_checked.update(new_checks)
+    # Checks found close together go out as one message
+    await ctx.check_outbox.flush(ctx)
     # else:
     #     logger.info("Not found new location")
 
@@ -180,6 +227,9 @@ async def handle_memory_update(ctx: 'Context') -> None:
     """Checks and modify memory for randomizer"""
     if ctx.slot_data is None:
         return
+    # The counters are only complete once the client cache is resumed or dropped
+    if ctx.resume_state is not None:
+        return
     await memory_update(ctx)
 
 
@@ -213,146 +263,207 @@ async def _write32(ctx, addr, value): # Not tested
 ################################################################
 # Dedicated Function for Client, which called common functions #
 ################################################################
+def build_memory_watch(layout: MemoryLayout) -> MemoryWatchRegistry:
+    registry = MemoryWatchRegistry()
+    layout.watch(registry, ("CurrentLevel", "BossFlags", "GemFlags", "PowerStoneFlags"))
+    for location in CHECK_INDEXES[layout.game_id].locations:
+        registry.watch(location["name"], location["Address"], CHECK_TYPE_SIZE[location["CheckType"]])
+    registry.compile()
+    return registry
+
 async def init_function(ctx):
-    ctx.power_stone = 0
-    ctx.white_gem = 0
-    ctx.red_gem = 0
-    ctx.blue_gem = 0
-    ctx.yellow_gem = 0
-    ctx.green_gem = 0
-    ctx.purple_gem = 0
+    ctx.memory_watch = build_memory_watch(ctx.memory_layout)
+    # Decoders for the layout fields, straight from the snapshot buffer
+    ctx.memory_fields = ctx.memory_layout.readers(ctx.memory_watch)
+    ctx.check_index = CHECK_INDEXES[ctx.game_id]
+    # A running RAM trace survives revalidation as long as the watched ranges stay the same
+    if getattr(ctx, "ram_trace", None) is not None and ctx.ram_trace.ranges != ctx.memory_watch.ranges:
+        start_ram_trace(ctx, "")
+    ctx.ram_trace = getattr(ctx, "ram_trace", None)
+    ctx.snapshot = None
+    ctx.previous_snapshot = None
+    ctx.check_baseline = None
+    ctx.catch_up_pending = True
+    ctx.check_planner = CheckPlanner(ctx.check_index)
+    ctx.shadow_memory = ShadowMemory()
+    ctx.poll_scheduler = PollScheduler(get_poll_policy())
+    client_settings = get_client_settings()
+    ctx.perf = ClientPerf(client_settings.perf_dump_interval_s if client_settings is not None else 0)
+
+    # Counters are rebuilt from items_received
+    ctx.item_counters = ItemCounters()
+    ctx.processed_item_count = 0
+    ctx.items_digest = items_digest(())
     
     ctx.power_stone_wait_counter = [0] * 8 # 0x6DBA0 ~ 6DBA7 8bytes
 
+def get_client_settings():
+    try:
+        from settings import get_settings
+        return get_settings().crash2_options
+    except Exception as e:
+        logger.warning(f"Using default client settings: {e}")
+        return None
+
+def get_poll_policy() -> PollPolicy:
+    client_settings = get_client_settings()
+    if client_settings is None:
+        return PollPolicy()
+    return PollPolicy.from_settings(client_settings)
+
+def start_ram_trace(ctx, path) -> bool:
+    """Stops the running trace, then starts a new one at path unless it is empty."""
+    if getattr(ctx, "ram_trace", None) is not None:
+        ctx.ram_trace.close()
+        logger.info(f"RAM trace saved to {ctx.ram_trace.path} ({ctx.ram_trace.tick} frames)")
+        ctx.ram_trace = None
+    if not path or getattr(ctx, "memory_watch", None) is None:
+        return False
+    ctx.ram_trace = RamTraceWriter(path, ctx.memory_watch.ranges, ctx.game_id)
+    logger.info(f"Recording RAM trace to {path}")
+    return True
+
+def init_slot_state(ctx, persistent: bool = True):
+    """Per seed/slot state, set up on every Connected."""
+    client_settings = get_client_settings()
+    window = client_settings.check_batch_window_ms / 1000 if client_settings is not None else 0.25
+    seed, slot = ctx.slot_data.get("Seed"), ctx.slot_data.get("Slot")
+    if not persistent or seed is None or slot is None:
+        ctx.check_outbox = CheckOutbox(None, window)
+        ctx.state_cache = None
+        ctx.resume_state = None
+        return
+
+    ctx.check_outbox = CheckOutbox(Utils.cache_path("crash2", "outbox", slot_file_name(seed, slot, ".json")), window)
+    ctx.state_cache = ClientStateCache(Utils.cache_path("crash2", "state", slot_file_name(seed, slot, ".json")))
+    ctx.resume_state = ctx.state_cache.load(ctx.game_id)
+    ctx.resume_deadline = time.monotonic() + RESUME_WAIT
+
+def resume_client_state(ctx) -> bool:
+    """
+    Restores the cached state once the server has sent at least the items it covers.
+    Returns False while still waiting for those items.
+    """
+    state = ctx.resume_state
+    count = state["processed_item_count"]
+    if len(ctx.items_received) < count and time.monotonic() < ctx.resume_deadline:
+        return False
+    ctx.resume_state = None
+    digest = items_digest(ctx.items_received[:count])
+    if len(ctx.items_received) < count or digest.hexdigest() != state["items_digest"]:
+        logger.info("Client cache does not match the server's items, replaying every item")
+        return True
+
+    try:
+        ctx.item_counters.load(state["counters"])
+        power_stone_wait_counter = list(state["power_stone_wait_counter"])
+        baseline = snapshot_from_dict(state["check_baseline"])
+    except (KeyError, TypeError, ValueError) as e:
+        logger.warning(f"Ignoring broken client cache: {e}")
+        ctx.item_counters.reset()
+        return True
+    ctx.processed_item_count = count
+    ctx.items_digest = digest
+    ctx.power_stone_wait_counter = power_stone_wait_counter
+    if baseline is not None and baseline.ranges == ctx.memory_watch.ranges:
+        ctx.check_baseline = baseline
+    logger.info(f"Resumed client state at item {count}")
+    return True
+
+def save_client_state(ctx, force: bool = False):
+    if ctx.state_cache is None or ctx.resume_state is not None:
+        return
+    ctx.state_cache.save({
+        "game_id": ctx.game_id,
+        "processed_item_count": ctx.processed_item_count,
+        "items_digest": ctx.items_digest.hexdigest(),
+        "counters": list(ctx.item_counters.values),
+        "power_stone_wait_counter": ctx.power_stone_wait_counter,
+        "check_baseline": snapshot_to_dict(ctx.check_baseline),
+    }, force)
+
+def get_current_level(ctx):
+    return ctx.memory_fields["CurrentLevel"](ctx.snapshot)
+
 def get_victory_code(ctx):
     victory_name = "Boss05" # This must can be changed by option
-    return Locations.location_table[victory_name].ap_code
-
-async def item_received(ctx, item_code, item_count):
-    # logger.info(f"{item_code}")
-    if item_code == 51000000: # power_stone
-        ctx.power_stone += 1
-    elif item_code == 51000001: # White Gem
-        ctx.white_gem += 1
-    elif item_code == 51000002: # Red Gem
-        ctx.red_gem += 1
-    elif item_code == 51000003: # Blue Gem
-        ctx.blue_gem += 1
-    elif item_code == 51000004: # Yellow Gem
-        ctx.yellow_gem += 1
-    elif item_code == 51000005: # Green Gem
-        ctx.green_gem += 1
-    elif item_code == 51000006: # Purple Gem
-        ctx.purple_gem += 1
-    elif item_code == 51000007: # Progressive Floor
-        ctx.power_stone += 5
-    else: # not implemented
-        pass
+    return location_index.code(victory_name)
+
+def get_new_checks(ctx):
+    level = get_current_level(ctx)
+    planner = ctx.check_planner
+    planner.update(level)
+    # Only the locations of the stages just left, on the return to the warp room
+    found = planner.checks(ctx.previous_snapshot, ctx.snapshot)
 
-async def is_location_checked(ctx, ap_code):
-    target_location = {}
-    # search target location
-    for location in LOCATIONS:
-        if location["Id"] == ap_code:
-            target_location = location
-            break
     #############################
     # Crash 2 Dedicated process #
     #############################
     # Only checking in WarpRoom
-    addr = ADDRESSES[ctx.game_id]["CurrentLevel"]
-    level = await _read8(ctx, addr)
-    if level != LEVEL.WarpRoom and level != LEVEL.BOSS05:
-        return False
+    if level not in TRUSTED_LEVELS:
+        return found
     #############################
     # Crash 2 Dedicated process #
     #############################
-    
-    # Check location flag
-    _value = 0
-    addr = target_location["Address"]
-    # addr = ctx.AddressConvert(addr)
-    if target_location["CheckType"] == CHECK_TYPE.bit or \
-        target_location["CheckType"] == CHECK_TYPE.falseBit:
-        _value = await _read8(ctx, addr)
-        _value = (_value >> target_location["AddressBit"]) & 0x01
-    elif target_location["CheckType"] == CHECK_TYPE.byte:
-        _value = await _read8(ctx, addr)
-    elif target_location["CheckType"] == CHECK_TYPE.short:
-        _value = await _read16(ctx, addr)
-    else:
-        _value = await _read32(ctx, addr)
-
-    _compare_value = 0
-    if target_location["CheckType"] == CHECK_TYPE.bit:
-        _compare_value = 0x01
-    elif target_location["CheckType"] == CHECK_TYPE.falseBit:
-        _compare_value = 0x00
-    else:
-        _compare_value = int(target_location["CheckValue"], 0)
 
-    _compare_type = COMPARE_TYPE.Match
-    if 'CompareType' in target_location:
-        _compare_type = target_location.CompareType
-
-    if _compare_type == COMPARE_TYPE.Match:
-        return (_value == _compare_value)
-    elif _compare_type == COMPARE_TYPE.GreaterThan:
-        return (_value > _compare_value)
-    elif _compare_type == COMPARE_TYPE.LessThan:
-        return (_value < _compare_value)
+    if ctx.catch_up_pending:
+        # First connect or resync: everything that changed since the cached snapshot, or a full scan without one
+        catch_up = ctx.check_index.diff(ctx.check_baseline, ctx.snapshot)
+        # memory_update only clears the bits forced on for received color gems later in this tick
+        catch_up.difference_update(ap_code for counter, ap_code in COLOR_GEM_CODES if ctx.item_counters[counter])
+        found |= catch_up
+        ctx.catch_up_pending = False
+    ctx.check_baseline = ctx.snapshot
+    return found
 
 
 async def memory_update(ctx):
     # Get Current Level
-    addr = ADDRESSES[ctx.game_id]["CurrentLevel"]
-    level = await _read8(ctx, addr)
+    level = get_current_level(ctx)
+    shadow = ctx.shadow_memory
 
+    power_stone_base = ctx.memory_layout.addresses["PowerStoneFlags"]
     # Check Powerstone and erase flag after location is found
     if level == LEVEL.WarpRoom:
-        power_stone_location = set([loc["Address"] for loc in LOCATIONS if "Power Stone" in loc["name"] ])
-        for idx, addr in enumerate(power_stone_location):
-            mem = await _read8(ctx, addr)
-            if mem == 0:
+        power_stone_flags = ctx.memory_fields["PowerStoneFlags"](ctx.snapshot)
+        for idx, byte in enumerate(POWER_STONE_LOCATION_BYTES):
+            if power_stone_flags[byte] == 0:
                 continue
             # if mem is changed, wait for location is found then clear flag
             ctx.power_stone_wait_counter[idx] += 1
             if ctx.power_stone_wait_counter[idx] > 1:
-                await _write8(ctx, addr, 0x00)
+                shadow.set8(power_stone_base + byte, 0x00)
                 ctx.power_stone_wait_counter[idx] = 0
-    
+
     # Power stone checker
-    dummy_power_stone_address_list = [0x6DBA0, 0x6DBA5, 0x6DBA6, 0x6DBA7]
-    for i in range(ctx.power_stone//8+1):
-        addr = dummy_power_stone_address_list[i]
-        if i == (ctx.power_stone//8):
-            values = [0x00, 0x01, 0x03, 0x07, 0x0f, 0x1f, 0x3f, 0x7f, 0xff]
-            await _write8(ctx, addr, values[(ctx.power_stone%8)])
+    counters = ctx.item_counters
+    power_stone = counters["power_stone"]
+    full_bytes = power_stone // 8
+    for i in range(min(full_bytes + 1, len(DUMMY_POWER_STONE_BYTES))):
+        if i == full_bytes:
+            shadow.set8(power_stone_base + DUMMY_POWER_STONE_BYTES[i], POWER_STONE_BYTE_VALUES[power_stone % 8])
         else:
-            await _write8(ctx, addr, 0xff)
-    
+            shadow.set8(power_stone_base + DUMMY_POWER_STONE_BYTES[i], 0xff)
+
     # Logic Fixes
     ## Color Gem
-    color_gem_addr = 0x6DA2B
-    write_val = 0x00
-    current_value = await _read8(ctx, color_gem_addr)
+    color_gem_address = ctx.memory_layout.addresses["GemFlags"] + COLOR_GEM_BYTE
+    current_value = ctx.memory_fields["GemFlags"](ctx.snapshot)[COLOR_GEM_BYTE]
     if level != LEVEL.WarpRoom:
         value = 0
-        if ctx.red_gem and level != LEVEL.Stage02:
-            value |= 0x04
-        if ctx.green_gem and level != LEVEL.Stage10:
-            value |= 0x08
-        if ctx.purple_gem and level != LEVEL.Stage20:
-            value |= 0x10
-        if ctx.blue_gem and level != LEVEL.Stage01:
-            value |= 0x20
-        if ctx.yellow_gem and level != LEVEL.Stage11:
-            value |= 0x40
+        for counter, gem_levels, bit in COLOR_GEM_BITS:
+            if counters[counter] and level not in gem_levels:
+                value |= bit
         write_val = (current_value | value)
     else:
         mask = 0x83 # 10000011
         write_val = (current_value & mask)
-    await _write8(ctx, color_gem_addr, write_val)
+    # The game sets White Gem bits in this byte too, so never overwrite a fresh change
+    shadow.set8(color_gem_address, write_val, guarded=True)
+
+    written = await shadow.flush(ctx, ctx.snapshot)
+    if written:
+        ctx.perf.record_write(written)
 
 ##############################
 # Other functions for coding #
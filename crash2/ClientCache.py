@@ -0,0 +1,75 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Iterable, Optional
+
+from .MemoryWatch import MemorySnapshot
+
+logger = logging.getLogger("Client")
+CACHE_VERSION = 1
+
+
+def items_digest(items: Iterable) -> "hashlib._Hash":
+    """Running digest of received items, extended with update_items_digest as more arrive."""
+    digest = hashlib.sha1()
+    update_items_digest(digest, items)
+    return digest
+
+
+def update_items_digest(digest: "hashlib._Hash", items: Iterable) -> None:
+    for item in items:
+        digest.update(f"{item.item},{item.location},{item.player};".encode("ascii"))
+
+
+def snapshot_to_dict(snapshot: Optional[MemorySnapshot]) -> Optional[dict]:
+    if snapshot is None:
+        return None
+    return {"ranges": snapshot.ranges, "blocks": [block.hex() for block in snapshot.blocks]}
+
+
+def snapshot_from_dict(data: Optional[dict]) -> Optional[MemorySnapshot]:
+    if not data:
+        return None
+    return MemorySnapshot([tuple(r) for r in data["ranges"]], [bytes.fromhex(block) for block in data["blocks"]])
+
+
+class ClientStateCache:
+    """Per seed/slot client state on disk, so a restarted client only replays what it missed."""
+
+    def __init__(self, path: str, save_interval: float = 1.0):
+        self.path = path
+        self.save_interval = save_interval
+        self.last_save = 0.0
+        self._last_saved: Optional[str] = None
+
+    def load(self, game_id: str) -> Optional[dict]:
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, "r") as file:
+                state = json.load(file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring client cache {self.path}: {e}")
+            return None
+        if state.get("version") != CACHE_VERSION or state.get("game_id") != game_id:
+            return None
+        return state
+
+    def save(self, state: dict, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self.last_save < self.save_interval:
+            return
+        self.last_save = now
+        data = json.dumps({"version": CACHE_VERSION, **state}, separators=(",", ":"))
+        if data == self._last_saved:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path + ".tmp", "w") as file:
+                file.write(data)
+            os.replace(self.path + ".tmp", self.path)
+            self._last_saved = data
+        except OSError as e:
+            logger.warning(f"Could not save client cache {self.path}: {e}")
@@ -0,0 +1,136 @@
+import json
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+# Histogram bucket upper bounds (ms), the last bucket catches everything above
+BUCKET_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram, cheap enough to update on every tick."""
+
+    def __init__(self):
+        self.buckets: List[int] = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float) -> None:
+        self.buckets[bisect_left(BUCKET_BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, p: float) -> float:
+        """Upper bound (ms) of the bucket holding the p-th percentile."""
+        if self.count == 0:
+            return 0.0
+        rank = p / 100 * self.count
+        seen = 0
+        for idx, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return BUCKET_BOUNDS_MS[idx] if idx < len(BUCKET_BOUNDS_MS) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class ClientPerf:
+    """Per phase latencies and BizHawk traffic of the game watcher."""
+
+    def __init__(self, dump_interval: float = 0):
+        self.dump_interval = dump_interval  # seconds between JSON dumps to the log, 0 to disable
+        self.reset()
+        self.last_dump = self.started
+
+    def reset(self) -> None:
+        # Rates in the report are per uptime, so they restart with the counts
+        self.started = time.monotonic()
+        self.tick_latency = LatencyHistogram()
+        self.phases: Dict[str, LatencyHistogram] = {}
+        self.ticks = 0
+        self.reads = 0
+        self.read_bytes = 0
+        self.writes = 0
+        self.write_bytes = 0
+
+    @contextmanager
+    def tick(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.tick_latency.add((time.perf_counter() - start) * 1000)
+            self.ticks += 1
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            histogram = self.phases.get(name)
+            if histogram is None:
+                histogram = self.phases[name] = LatencyHistogram()
+            histogram.add((time.perf_counter() - start) * 1000)
+
+    def record_read(self, size: int) -> None:
+        self.reads += 1
+        self.read_bytes += size
+
+    def record_write(self, size: int) -> None:
+        self.writes += 1
+        self.write_bytes += size
+
+    def to_dict(self) -> Dict[str, object]:
+        ticks = max(self.ticks, 1)
+        return {
+            "uptime_s": round(time.monotonic() - self.started, 1),
+            "ticks": self.ticks,
+            "tick": self.tick_latency.to_dict(),
+            "phases": {name: histogram.to_dict() for name, histogram in self.phases.items()},
+            "bizhawk": {
+                "reads": self.reads,
+                "read_bytes": self.read_bytes,
+                "writes": self.writes,
+                "write_bytes": self.write_bytes,
+                "reads_per_tick": round(self.reads / ticks, 3),
+                "writes_per_tick": round(self.writes / ticks, 3),
+                "bytes_per_tick": round((self.read_bytes + self.write_bytes) / ticks, 1),
+            },
+        }
+
+    def report(self) -> str:
+        data = self.to_dict()
+        lines = [f"{data['ticks']} ticks in {data['uptime_s']}s"]
+        for name, stats in [("tick", data["tick"]), *data["phases"].items()]:
+            lines.append(f"  {name:<26} mean {stats['mean_ms']:>8.3f}ms  p95 {stats['p95_ms']:>7}ms  "
+                         f"p99 {stats['p99_ms']:>7}ms  max {stats['max_ms']:>8.3f}ms")
+        bizhawk = data["bizhawk"]
+        lines.append(f"  bizhawk reads {bizhawk['reads']} ({bizhawk['read_bytes']} bytes), "
+                     f"writes {bizhawk['writes']} ({bizhawk['write_bytes']} bytes), "
+                     f"{bizhawk['reads_per_tick']} reads/tick, {bizhawk['writes_per_tick']} writes/tick, "
+                     f"{bizhawk['bytes_per_tick']} bytes/tick")
+        return "\n".join(lines)
+
+    def dump_due(self, now: Optional[float] = None) -> Optional[str]:
+        """JSON dump of the counters when dump_interval has elapsed, otherwise None."""
+        if not self.dump_interval:
+            return None
+        now = time.monotonic() if now is None else now
+        if now - self.last_dump < self.dump_interval:
+            return None
+        self.last_dump = now
+        return json.dumps(self.to_dict(), separators=(",", ":"))
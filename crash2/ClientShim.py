@@ -0,0 +1,78 @@
+"""
+Crash2Client, registered with BizHawkClient when the world is imported.
+
+Generate and MultiServer import every world but never run a BizHawk client, so this module only holds what the
+registration needs. The game watcher in .Client, and the modules it is built on, are imported by the first
+validate_rom.
+"""
+import logging
+from typing import Optional, TYPE_CHECKING
+
+from worlds._bizhawk.client import BizHawkClient
+
+from .Options import GAME_TITLE, GAME_TITLE_FULL
+
+if TYPE_CHECKING:
+    from worlds._bizhawk.context import BizHawkClientContext, BizHawkClientCommandProcessor
+
+logger = logging.getLogger("Client")
+
+
+def CommandProcessor(self: "BizHawkClientCommandProcessor"):
+    # This is not mandatory for the game. Just a client command implementation.
+    # def _cmd_kill(self):
+    #     """Kill the game."""
+    #     if isinstance(self.ctx, Crash2Context):
+    #         self.ctx.game_interface.kill_player()
+    pass
+
+
+class Crash2Client(BizHawkClient):
+    game = f"{GAME_TITLE_FULL}"
+    system = "PSX"
+    patch_suffix = ".apcrash2"
+
+    # Client variables
+    # One handler instance serves every BizHawkClientContext in the process, so per-session state lives on ctx
+    command_processor = CommandProcessor
+    last_error_message: Optional[str] = None
+    death_link_enabled = False
+    items_handling = 0b111 # This is mandatory
+    # For Bizhawk client
+    server = None
+    server_address = None
+    connect_address = None
+    _messagebox_connection_loss = False
+    disconnected_intentionally = False
+    current_reconnect_delay = 0
+    autoreconnect_task = None
+    max_size = 10_000_000  # 適当なバッファサイズでOK
+    def handle_connection_loss(self, message: str): logger.warning(f"Connection lost: {message}")
+    async def connection_closed(self): pass
+    def cancel_autoreconnect(self): pass
+
+
+    async def validate_rom(self, ctx: "BizHawkClientContext") -> bool:
+        from . import Client
+        return await Client.validate_rom(self, ctx)
+
+    async def game_watcher(self, ctx: "BizHawkClientContext") -> None:
+        from . import Client
+        await Client.game_watcher(ctx)
+
+    def make_gui(self):
+        from .Client import CLIENT_VERSION
+        ui = super().make_gui()
+        ui.base_title = f"{GAME_TITLE} Client v{CLIENT_VERSION}"
+        if tracker_loaded:
+            ui.base_title += f" | Universal Tracker {UT_VERSION}"
+
+        # AP version is added behind this automatically
+        ui.base_title += " | Archipelago"
+        return ui
+
+    def on_package(self, ctx, cmd: str, args: dict):
+        super().on_package(ctx, cmd, args)
+        if cmd == "Connected":
+            from . import Client
+            Client.on_connected(ctx, args)
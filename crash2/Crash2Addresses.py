@@ -8,17 +8,41 @@ class CHECK_TYPE:
   long = 6
   nibble = 7
 
+# Bytes read for each CHECK_TYPE
+CHECK_TYPE_SIZE = {
+  CHECK_TYPE.bit: 1,
+  CHECK_TYPE.int: 4,
+  CHECK_TYPE.uint: 4,
+  CHECK_TYPE.byte: 1,
+  CHECK_TYPE.short: 2,
+  CHECK_TYPE.falseBit: 1,
+  CHECK_TYPE.long: 8,
+  CHECK_TYPE.nibble: 1,
+}
+
 class COMPARE_TYPE:
   Match = 0
   GreaterThan = 1
   LessThan = 2
 
-ADDRESSES = {
+# Memory layout of each game version: field -> (address, struct format). Values are little endian.
+# Location addresses are those of DEFAULT_GAME_ID; other versions move them along with the field holding them.
+DEFAULT_GAME_ID = "SCPS-10047"
+LAYOUTS = {
   "SCPS-10047": {
-    "GAME_ID": 0x106CE,
-    "CurrentLevel": 0x699ec,
-  }
+    "GAME_ID": (0x106CE, "10s"),
+    "CurrentLevel": (0x699ec, "B"),
+    "BossFlags": (0x6D9D8, "2B"),       # Boss01~05 defeated flags
+    "GemFlags": (0x6DA24, "8B"),        # White Gem + Color Gem
+    "PowerStoneFlags": (0x6DBA0, "8B"), # Power Stone
+  },
+}
+
+ADDRESSES = {
+  game_id: {name: address for name, (address, _) in fields.items()}
+  for game_id, fields in LAYOUTS.items()
 }
+
 class LEVEL:
   WarpRoom = 0x02
   BOSS05 = 0x07
@@ -52,17 +76,18 @@ class LEVEL:
   NormalED = 0x29
   BestED = 0x28
 
-from .Locations import location_table
-LOCATIONS = []
-for name, loc_data in location_table.items():
-  LOCATIONS.append({
+from .StaticData import LOCATION_FLAGS, LOCATION_NAME_TO_ID
+LOCATIONS = [
+  {
     "name": name,
-    "Id": loc_data.ap_code,
-    "Address": loc_data.addr,
+    "Id": LOCATION_NAME_TO_ID[name],
+    "Address": address,
     "CheckType": CHECK_TYPE.bit,
-    "AddressBit": loc_data.bit,
-  })
-  
+    "AddressBit": bit,
+  }
+  for name, (address, bit) in LOCATION_FLAGS.items()
+]
+
   # {
   #   "Name": "Received Shock Cannon",
   #   "Id": 50001000,
@@ -0,0 +1,278 @@
+"""
+Serves several Crash2 client sessions from one asyncio process.
+
+Each session pairs one BizHawk connector port with one Archipelago slot and keeps all of its state on its own
+context. Each session runs its game watcher in its own task, at the poll interval its watcher asked for, so a slow
+or hung emulator only delays its own session, instead of one process per emulator.
+
+launch_headless runs a single session the same way, for running the client as a service without any GUI.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import Utils
+from CommonClient import server_loop
+import worlds._bizhawk as bizhawk
+from worlds._bizhawk.client import AutoBizHawkClientRegister
+from worlds._bizhawk.context import AuthStatus, BizHawkClientContext, EXPECTED_SCRIPT_VERSION
+
+from .ClientShim import Crash2Client # Unused, but required to register with BizHawkClient
+from .Options import GAME_TITLE
+
+logger = logging.getLogger("Client")
+
+CONNECTOR_HOST = "127.0.0.1"
+CONNECT_TIMEOUT = 5.0
+RECONNECT_DELAY = 5.0 # seconds between attempts while BizHawk or the game is not available
+
+# Name of the session whose code is running, for log lines
+session_name: ContextVar[str] = ContextVar("session_name", default="")
+
+
+class SessionLogFilter(logging.Filter):
+    """Prefixes log records with the session they were emitted from."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        name = session_name.get()
+        if name and not getattr(record, "session", None):
+            record.session = name
+            record.msg = f"[{name}] {record.msg}"
+        return True
+
+
+class SessionContext(BizHawkClientContext):
+    """BizHawkClientContext whose watcher is run by the daemon."""
+
+    def on_package(self, cmd: str, args: dict):
+        super().on_package(cmd, args)
+        # Same as the watcher_event wait of the standalone client
+        self.watcher_event.set()
+
+
+@dataclass
+class Session:
+    name: str
+    bizhawk_port: Optional[int] # None uses the first connector found, like the GUI client
+    ctx: SessionContext
+    waiting_message: bool = False
+    watcher_task: Optional["asyncio.Task[None]"] = None
+
+
+class Crash2Daemon:
+    """Runs the BizHawk watcher and server connection of every session on one event loop."""
+
+    def __init__(self):
+        self.sessions: List[Session] = []
+        self.exit_event = asyncio.Event()
+
+    def add_session(self, slot: str, bizhawk_port: Optional[int], server_address: str, password: Optional[str] = None) -> Session:
+        ctx = SessionContext(server_address, password)
+        # Known up front, so server_auth never asks for it
+        ctx.auth = slot
+        session = Session(slot, bizhawk_port, ctx)
+        self.sessions.append(session)
+        return session
+
+    def stop(self) -> None:
+        self.exit_event.set()
+
+    @staticmethod
+    def port_text(session: Session) -> str:
+        return "" if session.bizhawk_port is None else f" on port {session.bizhawk_port}"
+
+    async def connect_bizhawk(self, session: Session) -> bool:
+        """Connects to the connector on the session's own port, instead of the first free one bizhawk.connect finds."""
+        bizhawk_ctx = session.ctx.bizhawk_ctx
+        if session.bizhawk_port is None:
+            connected = await bizhawk.connect(bizhawk_ctx)
+        else:
+            try:
+                bizhawk_ctx.streams = await asyncio.wait_for(
+                    asyncio.open_connection(CONNECTOR_HOST, session.bizhawk_port), CONNECT_TIMEOUT)
+                bizhawk_ctx.connection_status = bizhawk.ConnectionStatus.TENTATIVE
+                bizhawk_ctx._port = session.bizhawk_port
+                connected = True
+            except (OSError, asyncio.TimeoutError):
+                connected = False
+        if not connected:
+            if not session.waiting_message:
+                logger.info(f"Waiting to connect to BizHawk{self.port_text(session)}...")
+                session.waiting_message = True
+            return False
+
+        script_version = await bizhawk.get_script_version(bizhawk_ctx)
+        if script_version != EXPECTED_SCRIPT_VERSION:
+            logger.info(f"Connector script{self.port_text(session)} is incompatible. "
+                        f"Expected version {EXPECTED_SCRIPT_VERSION} but got {script_version}.")
+            bizhawk.disconnect(bizhawk_ctx)
+            return False
+        await bizhawk.ping(bizhawk_ctx)
+        session.waiting_message = False
+        logger.info(f"Connected to BizHawk{self.port_text(session)}")
+        # The emulator may have loaded another game since the last connection
+        session.ctx.client_handler = None
+        return True
+
+    async def step(self, session: Session) -> float:
+        """One iteration of the session's game watcher. Returns the delay until its next one."""
+        session_name.set(session.name)
+        ctx = session.ctx
+        ctx.watcher_event.clear()
+        try:
+            if ctx.bizhawk_ctx.connection_status == bizhawk.ConnectionStatus.NOT_CONNECTED:
+                if not await self.connect_bizhawk(session):
+                    return RECONNECT_DELAY
+
+            # Same as the standalone client: another ROM may belong to another slot
+            rom_hash = await bizhawk.get_hash(ctx.bizhawk_ctx)
+            if ctx.rom_hash is not None and ctx.rom_hash != rom_hash:
+                if ctx.server is not None and not ctx.server.socket.closed:
+                    logger.info("ROM changed. Disconnecting from server.")
+
+                # The session stays bound to its slot, so ctx.auth is kept
+                ctx.username = None
+                ctx.client_handler = None
+                ctx.finished_game = False
+                await ctx.disconnect(False)
+            ctx.rom_hash = rom_hash
+
+            if ctx.client_handler is None:
+                system = await bizhawk.get_system(ctx.bizhawk_ctx)
+                ctx.client_handler = await AutoBizHawkClientRegister.get_handler(ctx, system)
+                if ctx.client_handler is None:
+                    logger.info(f"No handler was found for the game loaded in BizHawk{self.port_text(session)}")
+                    return RECONNECT_DELAY
+                logger.info(f"Running handler for {ctx.client_handler.game}")
+        except bizhawk.RequestFailedError as exc:
+            logger.info(f"Lost connection to BizHawk: {exc.args[0]}")
+            return RECONNECT_DELAY
+        except bizhawk.NotConnectedError:
+            return RECONNECT_DELAY
+
+        if ctx.server is not None and ctx.server.socket is not None:
+            if ctx.auth_status == AuthStatus.NOT_AUTHENTICATED:
+                Utils.async_start(ctx.server_auth(ctx.password_requested))
+        else:
+            ctx.auth_status = AuthStatus.NOT_AUTHENTICATED
+
+        await ctx.client_handler.game_watcher(ctx)
+        return ctx.watcher_timeout
+
+    async def run_session(self, session: Session) -> None:
+        """Runs the session's game watcher until the session exits, whatever the other sessions are doing."""
+        session_name.set(session.name)
+        ctx = session.ctx
+        while not ctx.exit_event.is_set():
+            try:
+                delay = await self.step(session)
+            except Exception:
+                logger.exception("Game watcher failed")
+                delay = RECONNECT_DELAY
+            try:
+                await asyncio.wait_for(ctx.watcher_event.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run(self) -> None:
+        for session in self.sessions:
+            # Tasks copy the current context, so their log lines carry the session name
+            session_name.set(session.name)
+            session.ctx.server_task = asyncio.create_task(server_loop(session.ctx), name=f"ServerLoop {session.name}")
+            session.watcher_task = asyncio.create_task(self.run_session(session), name=f"GameWatcher {session.name}")
+        session_name.set("")
+
+        exit_task = asyncio.create_task(self.exit_event.wait(), name="DaemonExit")
+        pending = {session.watcher_task for session in self.sessions}
+        try:
+            # Until stop() or until every session has exited
+            while pending and not exit_task.done():
+                _, pending = await asyncio.wait(pending | {exit_task}, return_when=asyncio.FIRST_COMPLETED)
+                pending.discard(exit_task)
+        finally:
+            exit_task.cancel()
+            for session in self.sessions:
+                session.watcher_task.cancel()
+            await asyncio.gather(*(session.watcher_task for session in self.sessions), return_exceptions=True)
+            for session in self.sessions:
+                session_name.set(session.name)
+                if session.ctx.bizhawk_ctx.connection_status != bizhawk.ConnectionStatus.NOT_CONNECTED:
+                    bizhawk.disconnect(session.ctx.bizhawk_ctx)
+                await session.ctx.shutdown()
+
+
+def parse_session(text: str, default_server: Optional[str]) -> Tuple[str, int, str]:
+    """SLOT:PORT[@SERVER] -> (slot, BizHawk connector port, server address)"""
+    session, _, server = text.rpartition("@") if "@" in text else (text, "", "")
+    slot, _, port = session.rpartition(":")
+    server = server or default_server
+    if not slot or not port.isdigit():
+        raise ValueError(f"Expected SLOT:PORT[@SERVER], got {text!r}")
+    if not server:
+        raise ValueError(f"No server address for session {slot!r}. Use --connect or SLOT:PORT@SERVER")
+    return slot, int(port), server
+
+
+def init_logging(log_file: Optional[str], level: str) -> None:
+    """Logs to stdout, or to log_file, without the GUI client's log window."""
+    handler = logging.FileHandler(log_file, encoding="utf-8") if log_file else logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    handler.addFilter(SessionLogFilter())
+    logging.basicConfig(level=level.upper(), handlers=[handler], force=True)
+
+
+def add_logging_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--log-file", default=None, help="Write the log to this file instead of stdout")
+    parser.add_argument("--log-level", default="info", choices=["debug", "info", "warning", "error"])
+
+
+def run_sessions(sessions: List[Tuple[str, Optional[int], str]], password: Optional[str]) -> None:
+    async def main():
+        daemon = Crash2Daemon()
+        for slot, port, server in sessions:
+            daemon.add_session(slot, port, server, password)
+        await daemon.run()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+
+
+def launch_daemon(*args: str) -> None:
+    parser = argparse.ArgumentParser(description=f"{GAME_TITLE} client daemon, one process for several BizHawk sessions")
+    parser.add_argument("--connect", default=None, help="Archipelago server address for sessions without their own")
+    parser.add_argument("--password", default=None, help="Password of the multiworld")
+    parser.add_argument("--session", action="append", required=True, metavar="SLOT:PORT[@SERVER]",
+                        help="Slot name and BizHawk connector port of a session. Repeat once per emulator")
+    add_logging_arguments(parser)
+    options = parser.parse_args(args)
+    try:
+        sessions = [parse_session(text, options.connect) for text in options.session]
+    except ValueError as e:
+        parser.error(str(e))
+
+    init_logging(options.log_file, options.log_level)
+    run_sessions(sessions, options.password)
+
+
+def launch_headless(*args: str) -> None:
+    parser = argparse.ArgumentParser(description=f"{GAME_TITLE} client without GUI")
+    parser.add_argument("--connect", required=True, help="Archipelago server address, e.g. archipelago.gg:38281")
+    parser.add_argument("--name", required=True, help="Slot name")
+    parser.add_argument("--password", default=None, help="Password of the multiworld")
+    parser.add_argument("--bizhawk-port", type=int, default=None,
+                        help="BizHawk connector port. By default the first connector found is used")
+    add_logging_arguments(parser)
+    options = parser.parse_args(args)
+
+    init_logging(options.log_file, options.log_level)
+    run_sessions([(options.name, options.bizhawk_port, options.connect)], options.password)
+
+
+if __name__ == "__main__":
+    launch_daemon(*sys.argv[1:])
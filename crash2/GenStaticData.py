@@ -0,0 +1,233 @@
+"""
+Generates StaticData.py, the location tables the world and the client load, from the stage tables below.
+
+The tables used to be derived on every import of the world. Rerun this after editing them:
+    python crash2/GenStaticData.py
+"""
+import argparse
+import os
+import sys
+from typing import Dict, List, Tuple
+
+# ap_code, region, address, bit
+Record = Tuple[int, str, int, int]
+
+OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "StaticData.py")
+
+# ap_code = 50_XX_YY_ZZ:
+#   XX: 00 == stage, 01 == boss
+#   YY: stage(01~27), if boss, set 00
+#   ZZ: item_number(starts 1)
+
+# Power Stone: 0x6DBA0 ~ 6DBA7 (8 byte) Max 64(stage(25) + unused(39))
+#   Used: 6DBA0: 00 F4 EF EF 5F 00 00 00
+# Gem: 0x6DA24 ~ 0x6DA2B ( 8 byte ) Max 64(White(37) + Color(5) + unused(22))
+#   Used: 6DA24: FE F7 EF EF FF 00 00 7E
+# Color Gem
+#   Red:    0x6DA2B: 0000_0X00(3bit) 0x04
+#   Green:  0x6DA2B: 0000_X000(4bit) 0x08
+#   Purple: 0x6DA2B: 000X_0000(5bit) 0x10
+#   Blue:   0x6DA2B: 00X0_0000(6bit) 0x20
+#   Yellow: 0x6DA2B: 0X00_0000(7bit) 0x40
+#   Unknown:0x6DA2B: X000_0000(8bit) 0x80
+#
+# 6DA84: Boss defeated flag?? 
+#   0x0006D9D8: C8 1100_1000
+#               Boss01: 0x40
+#               Boss03: 0x08
+#               Boss05: 0x80
+#   0x0006D9D9: 43 1000_0011
+#               Boss02: 0x01
+#               Boss04: 0x02
+#               ??????: 0x40
+# 
+# Power stone:
+#  0x6DBA0: (not used) Done: 0
+#  0x6DBA1: Done: 5
+#  0x6DBA2: Done: 7
+#  0x6DBA3: Done: 7
+#  0x6DBA4: Done: 6
+#  0x6DBA5: (not used)
+#  0x6DBA6: (not used)
+#  0x6DBA7: (not used)
+# Gem
+#  0x6DA24: Done: 7
+#  0x6DA25: Done: 7
+#  0x6DA26: Done: 7
+#  0x6DA27: Done: 7
+#  0x6DA28: Done: 8
+#  0x6DA29: Dummy: 0
+#  0x6DA2A: Dummy: 0
+#  0x6DA2B: 1 + color x5
+# Stage_dict = {location_name: address_bit}
+stage_dict = {
+    "Stage01: Power Stone": 8*3+6, # 0x6DBA3: 0x40 0X00_0000
+    "Stage01: White Gem"  : 8*3+6, # 0x6DA27: 0x40 0X00_0000
+    "Stage01: Blue Gem(Not break boxes)"   : 8*7+5, # 0x6DA2B: 00X0_0000(6bit) 0x20
+    "Stage02: Power Stone": 8*1+6, # 0x6DBA1: 0x40 0X00_0000
+    "Stage02: White Gem"  : 8*1+6, # 0x6DA25: 0X00_0000 0x40
+    "Stage02: Red Gem(from Stage07)"    : 8*7+2, # 0x6DA2B: 0000_0X00(3bit) 0x04
+    "Stage03: Power Stone": 8*3+1, # 0x6DBA3: 0x02 0000_00X0
+    "Stage03: White Gem1(need Blue Gem)" : 8*3+1, # 0x6DA27: 0x02 0000_00X0
+    "Stage03: White Gem2(time trial)" : 8*0+1, # 0x6DA24: 0x02 0000_00X0
+    "Stage04: Power Stone": 8*3+7, # 0x6DBA3: 0x80 X000_0000
+    "Stage04: White Gem"  : 8*3+7, # 0x6DA27: 0x80 X000_0000
+    "Stage05: Power Stone": 8*3+0, # 0x6DBA3: 0x01 0000_000X
+    "Stage05: White Gem"  : 8*3+0, # 0x6DA27: 0x01 0000_000X
+    "Stage06: Power Stone": 8*2+1, # 0x6DBA2: 0x02 0000_00X0
+    "Stage06: White Gem(need Red Gem)"  : 8*2+1, # 0x6DA26: 0x02 0000_00X0
+    "Stage07: Power Stone": 8*4+0, # 0x6DBA4: 0x01 0000_000X
+    "Stage07: White Gem1(from Stage13)" : 8*4+0, # 0x6DA28: 0x01 0000_000X 
+    "Stage07: White Gem2(Dokuro course)" : 8*0+2, # 0x6DA24: 0x04 0000_0X00
+    "Stage08: Power Stone": 8*3+5, # 0x6DBA3: 0x20 00X0_0000
+    "Stage08: White Gem"  : 8*3+5, # 0x6DA27: 0x20 00X0_0000
+    "Stage09: Power Stone": 8*3+3, # 0x6DBA3: 0x08 0000_X000
+    "Stage09: White Gem"  : 8*3+3, # 0x6DA27: 0x08 0000_X000
+    "Stage10: Power Stone": 8*4+3, # 0x6DBA4: 0x08 0000_X000
+    "Stage10: White Gem"  : 8*4+3, # 0x6DA28: 0x08 0000_X000 
+    "Stage10: Green Gem"  : 8*7+3, # 0x6DA2B: 0000_X000(4bit) 0x08
+    "Stage11: Power Stone": 8*4+1, # 0x6DBA4: 0x02 0000_00X0
+    "Stage11: White Gem"  : 8*4+1, # 0x6DA28: 0x02 0000_00X0 
+    "Stage11: Yellow Gem(time trial)" : 8*7+6, # 0x6DA2B: 0X00_0000(7bit) 0x40
+    "Stage12: Power Stone": 8*1+2, # 0x6DBA1: 0x04 0000_0X00
+    "Stage12: White Gem1" : 8*1+2, # 0x6DA25: 0x04 0000_0X00 
+    "Stage12: White Gem2(need Yellow Gem)" : 8*0+3, # 0x6DA24: 0x08 0000_X000
+    "Stage13: Power Stone": 8*4+2, # 0x6DBA4: 0x04 0000_0X00
+    "Stage13: White Gem"  : 8*4+2, # 0x6DA28: 0x04 0000_0X00 
+    "Stage14: Power Stone": 8*2+6, # 0x6DBA2: 0x40 0X00_0000
+    "Stage14: White Gem1(from Stage17)" : 8*2+6, # 0x6DA26: 0x40 0X00_0000
+    "Stage14: White Gem2" : 8*0+4, # 0x6DA24: 0x10 000X_0000 
+    "Stage15: Power Stone": 8*2+7, # 0x6DBA2: 0x80 X000_0000
+    "Stage15: White Gem"  : 8*2+7, # 0x6DA26: 0x80 X000_0000 
+    "Stage16: Power Stone": 8*1+5, # 0x6DBA1: 0x20 00X0_0000
+    "Stage16: White Gem"  : 8*1+5, # 0x6DA25: 0x20 00X0_0000 
+    "Stage17: Power Stone": 8*2+5, # 0x6DBA2: 0x20 00X0_0000
+    "Stage17: White Gem1" : 8*2+5, # 0x6DA26: 0x20 00X0_0000 
+    "Stage17: White Gem2" : 8*1+0, # 0x6DA25: 0x01 0000_000X 
+    "Stage18: Power Stone": 8*2+3, # 0x6DBA2: 0x08 0000_X000
+    "Stage18: White Gem1" : 8*2+3, # 0x6DA26: 0x08 0000_X000
+    "Stage18: White Gem2" : 8*1+1, # 0x6DA25: 0x02 0000_00X0 
+    "Stage19: Power Stone": 8*1+7, # 0x6DBA1: 0x80 X000_0000
+    "Stage19: White Gem1" : 8*1+7, # 0x6DA25: 0x80 X000_0000
+    "Stage19: White Gem2(need Green Gem)" : 8*7+1, # 0x6DA2B: 0x02 0000_00X0
+    "Stage20: Power Stone": 8*4+4, # 0x6DBA4: 0x10 000X_0000
+    "Stage20: White Gem"  : 8*4+4, # 0x6DA28: 0x10 000X_0000 
+    "Stage20: Purple Gem" : 8*7+4, # 0x6DA2B: 000X_0000(5bit) 0x10
+    "Stage21: Power Stone": 8*2+0, # 0x6DBA2: 0x01 0000_000X
+    "Stage21: White Gem1" : 8*2+0, # 0x6DA26: 0x01 0000_000X
+    "Stage21: White Gem2" : 8*0+5, # 0x6DA24: 0x20 00X0_0000 
+    "Stage22: Power Stone": 8*2+2, # 0x6DBA2: 0x04 0000_0X00
+    "Stage22: White Gem"  : 8*2+2, # 0x6DA26: 0x04 0000_0X00
+    "Stage23: Power Stone": 8*1+4, # 0x6DBA1: 0x10 000X_0000
+    "Stage23: White Gem1" : 8*1+4, # 0x6DA25: 0x10 000X_0000 
+    "Stage23: White Gem2" : 8*0+6, # 0x6DA24: 0x40 0X00_0000 
+    "Stage24: Power Stone": 8*3+2, # 0x6DBA3: 0x04 0000_0X00
+    "Stage24: White Gem"  : 8*3+2, # 0x6DA27: 0x04 0000_X000
+    "Stage25: Power Stone": 8*4+6, # 0x6DBA4: 0x40 0X00_0000
+    "Stage25: White Gem1" : 8*4+6, # 0x6DA28: 0x40 0X00_0000 
+    "Stage25: White Gem2(need All Color Gems)" : 8*0+7, # 0x6DA24: 0x80 X000_0000 
+    # Secret stage
+    "Stage26: White Gem"  : 8*4+5, # 0x6DA28: 0x20 00X0_0000 
+    "Stage27: White Gem"  : 8*4+7, # 0x6DA28: 0x80 X000_0000 
+}
+
+def gen_stage_locations(stage_dict: Dict[str, int]) -> Dict[str, Record]:
+    location_dict = {}
+    item_counter = 1
+    prev_stage_num = 0
+    for name, data in stage_dict.items():
+        stage_num = int(name.split(":")[0].replace("Stage",""), 10) -1 # 1~5 -> 0~4
+        floor_num = stage_num // 5 + 1
+        if stage_num == prev_stage_num:
+            item_counter += 1
+        else:
+            item_counter = 1  
+        prev_stage_num = stage_num
+        # AP code
+        ap_code = 50000000 + stage_num*100 + item_counter
+        # Region
+        region = f"{floor_num}F"
+        if floor_num > 5: # Secret stage case
+            region = f"{name.split(':')[0]}"
+        # Address
+        if "Gem" in name:
+            addr = 0x6DA24 + (data//8)
+        else: # Power Stone
+            addr = 0x6DBA0 + (data//8)
+        # Bit
+        bit =  (data % 8)
+
+        # Generate locations
+        location_dict[name] = (ap_code, region, addr, bit)
+    return location_dict
+
+stage_locations = gen_stage_locations(stage_dict)
+boss_locations = {
+    "Boss01": (50010001, "2F", 0x0006D9D8, 6),
+    "Boss02": (50010002, "3F", 0x0006D9D9, 0),
+    "Boss03": (50010003, "4F", 0x0006D9D8, 3),
+    "Boss04": (50010004, "5F", 0x0006D9D9, 1),
+    "Boss05": (50010005, "6F", 0x0006D9D8, 7),
+}
+
+
+def format_record(name: str, record: Record) -> str:
+    ap_code, region, addr, bit = record
+    return f"    {name!r}: ({ap_code}, {region!r}, 0x{addr:05X}, {bit}),"
+
+
+def render() -> str:
+    """Source of StaticData.py"""
+    location_table = {**stage_locations, **boss_locations}
+    region_names: Dict[str, List[str]] = {}
+    for name, (_, region, _, _) in location_table.items():
+        region_names.setdefault(region, []).append(name)
+
+    lines = [
+        "# Generated by GenStaticData.py, do not edit. Rerun it after changing its tables:",
+        "#     python crash2/GenStaticData.py",
+        "",
+        "# Location records: name -> (ap_code, region, address, bit)",
+        "STAGE_LOCATIONS = {",
+        *(format_record(name, record) for name, record in stage_locations.items()),
+        "}",
+        "BOSS_LOCATIONS = {",
+        *(format_record(name, record) for name, record in boss_locations.items()),
+        "}",
+        "",
+        "LOCATION_NAME_TO_ID = {",
+        *(f"    {name!r}: {ap_code}," for name, (ap_code, _, _, _) in location_table.items()),
+        "}",
+        "",
+        "# Region -> its location names, in table order",
+        "REGION_LOCATIONS = {",
+        *(line for region, names in region_names.items()
+          for line in (f"    {region!r}: (", *(f"        {name!r}," for name in names), "    ),")),
+        "}",
+        "",
+        "# Location name -> (address, bit) of its collected flag",
+        "LOCATION_FLAGS = {",
+        *(f"    {name!r}: (0x{addr:05X}, {bit})," for name, (_, _, addr, bit) in location_table.items()),
+        "}",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="only check that StaticData.py is up to date")
+    args = parser.parse_args()
+
+    source = render()
+    if args.check:
+        with open(OUTPUT) as file:
+            if file.read() != source:
+                sys.exit(f"{OUTPUT} is out of date, rerun {os.path.basename(__file__)}")
+        return
+    with open(OUTPUT, "w") as file:
+        file.write(source)
+
+
+if __name__ == "__main__":
+    main()
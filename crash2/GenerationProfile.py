@@ -0,0 +1,93 @@
+import json
+import logging
+import os
+import time
+import weakref
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterator, Optional
+
+from .Options import GAME_TITLE_FULL
+
+logger = logging.getLogger(GAME_TITLE_FULL)
+
+PHASES = ("generate_early", "create_regions", "create_items", "set_rules", "fill_slot_data")
+
+
+def object_counts(world) -> Dict[str, int]:
+    regions = list(world.multiworld.get_regions(world.player))
+    return {
+        "regions": len(regions),
+        "locations": sum(len(region.locations) for region in regions),
+        "entrances": sum(len(region.exits) for region in regions),
+    }
+
+
+class GenerationProfile:
+    """
+    Phase timings and created object counts of every Crash 2 player in one multiworld.
+    Written to <directory>/<seed>.json once the last player has filled its slot data.
+    """
+
+    def __init__(self, multiworld, directory: str):
+        self.multiworld = multiworld
+        self.directory = directory
+        self.players: Dict[int, Dict[str, dict]] = {}
+
+    @contextmanager
+    def phase(self, world, name: str) -> Iterator[dict]:
+        """Times a phase of one player. Extra counts can be stored in the yielded dict."""
+        before = object_counts(world)
+        record: dict = {}
+        start = time.perf_counter()
+        yield record
+        record["seconds"] = time.perf_counter() - start
+        after = object_counts(world)
+        for key, value in after.items():
+            if value != before[key]:
+                record[key] = value - before[key]
+        self.players.setdefault(world.player, {})[name] = record
+        if name == PHASES[-1] and self.finished() == len(self.multiworld.get_game_players(GAME_TITLE_FULL)):
+            self.write()
+
+    def finished(self) -> int:
+        return sum(PHASES[-1] in phases for phases in self.players.values())
+
+    def to_dict(self) -> dict:
+        players = {}
+        for player, phases in sorted(self.players.items()):
+            players[self.multiworld.player_name[player]] = {
+                "player": player,
+                "seconds": sum(record["seconds"] for record in phases.values()),
+                "phases": phases,
+            }
+        return {"seed": self.multiworld.seed_name, "game": GAME_TITLE_FULL, "players": players}
+
+    def write(self) -> Optional[str]:
+        path = os.path.join(self.directory, f"{self.multiworld.seed_name}.json")
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(path, "w") as file:
+                json.dump(self.to_dict(), file, indent=1)
+        except OSError as e:
+            logger.warning(f"Could not write generation profile {path}: {e}")
+            return None
+        return path
+
+
+# One profile per multiworld, shared by its Crash 2 players
+_profiles: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def get_profile(multiworld, directory: str) -> Optional[GenerationProfile]:
+    if not directory:
+        return None
+    if multiworld not in _profiles:
+        _profiles[multiworld] = GenerationProfile(multiworld, directory)
+    return _profiles[multiworld]
+
+
+def profile_phase(world, name: str):
+    """Context manager timing one generation phase of world, a no-op unless profiling is enabled."""
+    if world.generation_profile is None:
+        return nullcontext({})
+    return world.generation_profile.phase(world, name)
@@ -0,0 +1,51 @@
+from typing import Dict, Generic, Hashable, Iterator, List, Mapping, Optional, Tuple, TypeVar
+
+from .Items import ItemData, item_table
+from .Locations import LocData, location_table
+from .StaticData import REGION_LOCATIONS
+
+Data = TypeVar("Data", ItemData, LocData)
+
+
+class TableIndex(Generic[Data]):
+    """
+    Constant time lookups into an item or location table, built once and shared by every world and client.
+    Names are grouped by one field of the records (classification for items, region for locations), in table order,
+    unless the groups are given.
+    """
+
+    def __init__(self, table: Mapping[str, Data], group_field: str,
+                 groups: Optional[Mapping[Hashable, Tuple[str, ...]]] = None):
+        self.by_name: Dict[str, Data] = dict(table)
+        self.by_code: Dict[int, Data] = {data.ap_code: data for data in table.values() if data.ap_code is not None}
+        self.name_to_code: Dict[str, int] = {name: data.ap_code for name, data in table.items() if data.ap_code is not None}
+        self.code_to_name: Dict[int, str] = {code: name for name, code in self.name_to_code.items()}
+        if groups is None:
+            grouped: Dict[Hashable, List[str]] = {}
+            for name, data in table.items():
+                grouped.setdefault(getattr(data, group_field), []).append(name)
+            groups = {key: tuple(names) for key, names in grouped.items()}
+        self.groups: Mapping[Hashable, Tuple[str, ...]] = groups
+
+    def code(self, name: str) -> Optional[int]:
+        data = self.by_name.get(name)
+        return None if data is None else data.ap_code
+
+    def names(self, group: Hashable) -> Tuple[str, ...]:
+        return self.groups.get(group, ())
+
+
+item_index: TableIndex[ItemData] = TableIndex(item_table, "classification")
+# The region groups are the generated REGION_LOCATIONS, the only region -> locations table
+location_index: TableIndex[LocData] = TableIndex(location_table, "region", REGION_LOCATIONS)
+
+
+def get_ap_code(location_name) -> list:
+    code = location_index.code(location_name)
+    return [] if code is None else [code]
+
+def filter_items(classification) -> Iterator[Tuple[str, ItemData]]:
+    return ((name, item_index.by_name[name]) for name in item_index.names(classification))
+
+def filter_item_names(classification) -> Iterator[str]:
+    return iter(item_index.names(classification))
@@ -0,0 +1,62 @@
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, NamedTuple, Tuple
+
+from .Index import item_index
+
+
+class ItemEffect(NamedTuple):
+    counter: str
+    amount: int = 1
+
+
+# Client side counters, in array order
+COUNTERS = ("power_stone", "white_gem", "red_gem", "blue_gem", "yellow_gem", "green_gem", "purple_gem")
+COUNTER_INDEX = {name: idx for idx, name in enumerate(COUNTERS)}
+
+# item name -> effect on the counters
+ITEM_EFFECTS: Dict[str, ItemEffect] = {
+    "Power Stone"      : ItemEffect("power_stone"),
+    "White Gem"        : ItemEffect("white_gem"),
+    "Red Gem"          : ItemEffect("red_gem"),
+    "Blue Gem"         : ItemEffect("blue_gem"),
+    "Yellow Gem"       : ItemEffect("yellow_gem"),
+    "Green Gem"        : ItemEffect("green_gem"),
+    "Purple Gem"       : ItemEffect("purple_gem"),
+    "Progressive Floor": ItemEffect("power_stone", 5),
+}
+
+# ap_code -> (counter index, amount)
+EFFECTS_BY_ID: Dict[int, Tuple[int, int]] = {
+    item_index.name_to_code[name]: (COUNTER_INDEX[effect.counter], effect.amount)
+    for name, effect in ITEM_EFFECTS.items()
+}
+
+
+class ItemCounters:
+    """Received item counters, stored in one compact array."""
+
+    def __init__(self):
+        self.values = array("l", [0] * len(COUNTERS))
+
+    def __getitem__(self, name: str) -> int:
+        return self.values[COUNTER_INDEX[name]]
+
+    def reset(self) -> None:
+        for idx in range(len(self.values)):
+            self.values[idx] = 0
+
+    def load(self, values) -> None:
+        if len(values) != len(COUNTERS):
+            raise ValueError(f"Expected {len(COUNTERS)} counters, got {len(values)}")
+        self.values = array("l", values)
+
+    def apply(self, item_ids: Iterable[int]) -> None:
+        """Applies a whole batch of received items in one pass."""
+        values = self.values
+        for item_id, count in Counter(item_ids).items():
+            effect = EFFECTS_BY_ID.get(item_id)
+            if effect is None: # not implemented (filler, victory)
+                continue
+            idx, amount = effect
+            values[idx] += amount * count
@@ -1,11 +1,13 @@
 from BaseClasses import Item, ItemClassification
-from .Locations import get_total_locations, location_table, get_ap_code
+from .Locations import get_total_locations
 from typing import List, Dict, TYPE_CHECKING, NamedTuple, Optional
-from .Options import GAME_TITLE_FULL, UseProgressItemInsteadOfPowerStones
+from .Options import GAME_TITLE_FULL, UseProgressItemInsteadOfPowerStones, filler_weights
 if TYPE_CHECKING:
     from . import Crash2World
 
 class Crash2Item(Item):
+    # Item keeps its fields in slots, so this drops the per-instance __dict__ and __weakref__
+    __slots__ = ()
     game = GAME_TITLE_FULL
 
 class ItemData(NamedTuple):
@@ -13,12 +15,11 @@ class ItemData(NamedTuple):
    classification: ItemClassification
    count: Optional[int] = 1
 
-def create_itempool(world) -> List[Item]:
-    itempool: List[Item] = []
+def get_pool_item_names(world) -> List[str]:
+    """Names of the items in the pool, filler excluded, one entry per copy."""
     options = world.options
-    junk_dict = junk_items
-
-    for name in item_table.keys():
+    names: List[str] = []
+    for name, data in item_table.items():
         # Progress item option
         if options.UseProgressItemInsteadOfPowerStones.value == UseProgressItemInsteadOfPowerStones.option_use_progress_items:
             if "Power Stone" in name:
@@ -26,39 +27,46 @@ def create_itempool(world) -> List[Item]:
         else: # options.UseProgressItemInsteadOfPowerStones.value == UseProgressItemInsteadOfPowerStones.option_use_powerstone_as_vanilla:
             if "Progressive Floor" in name:
                 continue
+        names += [name] * data.count
+    return names
 
-        item_type: ItemClassification = item_table.get(name).classification
-        item_amount: int = item_table.get(name).count
-        itempool += create_multiple_items(world, name, item_amount, item_type)
-
-    for loc in world.multiworld.get_locations(world.player):
-        print(f"  '{loc.name}: {get_ap_code(loc.name)}'")
-
+def place_victory_item(world) -> None:
     victory = create_item(world, "Defeat Cortex!")
     world.multiworld.get_location("Boss05", world.player).place_locked_item(victory)
-    itempool += create_junk_items(world, get_total_locations(world) - len(itempool) - 1, junk_dict)
-    return itempool
-
-def create_multiple_items(world, name: str, count: int = 1,
-                          item_type: ItemClassification = ItemClassification.progression) -> List[Item]:
-    data = item_table[name]
-    itemlist: List[Item] = []
 
-    for i in range(count):
-        itemlist += [Crash2Item(name, item_type, data.ap_code, world.player)]
+def create_itempool(world) -> List[Item]:
+    names = get_pool_item_names(world)
 
-    return itemlist
+    place_victory_item(world)
+    names += get_junk_item_names(world, get_total_locations(world) - len(names) - 1)
+    # The whole pool, filler included, in one pass
+    return create_items_bulk(world, names)
 
 def create_item(world, name: str) -> Item:
     data = item_table[name]
     return Crash2Item(name, data.classification, data.ap_code, world.player)
 
-def create_junk_items(world, count: int, junk_dict: Dict[str, object]) -> List[Item]:
-    junk_pool: List[Item] = []
-    # For now, all junk has equal weights
-    for i in range(count):
-        junk_pool.append(world.create_item(world.random.choices(list(junk_dict.keys()), k=1)[0]))
-    return junk_pool
+def create_items_bulk(world, names: List[str]) -> List[Item]:
+    """Creates many items at once, looking each distinct name up only once."""
+    player = world.player
+    data = {name: (item_table[name].classification, item_table[name].ap_code) for name in set(names)}
+    return [Crash2Item(name, *data[name], player) for name in names]
+
+def get_filler_weights(world) -> Dict[str, int]:
+    """Filler weights of the FillerWeights option, the filler table without it."""
+    weights = {name: weight for name, weight in world.options.FillerWeights.value.items()
+               if name in junk_items and weight > 0}
+    return weights or dict(filler_weights)
+
+def get_junk_item_names(world, count: int) -> List[str]:
+    if count <= 0:
+        return []
+    weights = get_filler_weights(world)
+    # One weighted draw for the whole filler pool
+    return world.random.choices(list(weights.keys()), weights=list(weights.values()), k=count)
+
+def create_junk_items(world, count: int) -> List[Item]:
+    return create_items_bulk(world, get_junk_item_names(world, count))
 
 items = {
     "Power Stone": ItemData(51000000, ItemClassification.progression, 25),
@@ -83,9 +91,3 @@ item_table ={
     **junk_items,
 }
 
-def filter_items(classification):
-    return filter(lambda l: l[1].classification == (classification), item_table.items())
-
-def filter_item_names(classification):
-    return map(lambda entry: entry[0], filter_items(classification))
-
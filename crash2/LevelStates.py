@@ -0,0 +1,144 @@
+import re
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set
+
+from .CheckDetector import LocationCheckIndex
+from .Crash2Addresses import LEVEL
+from .Locations import stage_locations, boss_locations
+from .MemoryWatch import MemorySnapshot
+
+# Location flags are only trusted in these levels
+TRUSTED_LEVELS = (LEVEL.WarpRoom, LEVEL.BOSS05)
+# Warp room ticks after the entry scan during which flags set late by the game are still picked up
+SETTLE_TICKS = 3
+# Secret stages are entered from a stage of this floor (see Regions.create_regions)
+SECRET_STAGE_FLOOR = {"Stage26": "3F", "Stage27": "4F"}
+
+LevelHook = Callable[[int, Optional[int]], None]
+
+
+class LevelStateMachine:
+    """
+    CurrentLevel as a state machine. Enter hooks get (level, previous level), exit hooks get (level, next level).
+    Hooks registered for None run on every transition.
+    """
+
+    def __init__(self):
+        self.level: Optional[int] = None
+        self.enter_hooks: Dict[Optional[int], List[LevelHook]] = {}
+        self.exit_hooks: Dict[Optional[int], List[LevelHook]] = {}
+
+    def on_enter(self, level: Optional[int], hook: LevelHook) -> None:
+        self.enter_hooks.setdefault(level, []).append(hook)
+
+    def on_exit(self, level: Optional[int], hook: LevelHook) -> None:
+        self.exit_hooks.setdefault(level, []).append(hook)
+
+    def update(self, level: int) -> bool:
+        """Returns True when the level changed."""
+        if level == self.level:
+            return False
+        previous = self.level
+        if previous is not None:
+            for hook in self.exit_hooks.get(previous, []) + self.exit_hooks.get(None, []):
+                hook(previous, level)
+        self.level = level
+        for hook in self.enter_hooks.get(level, []) + self.enter_hooks.get(None, []):
+            hook(level, previous)
+        return True
+
+
+def build_level_checks() -> Dict[int, Set[int]]:
+    """Stage level -> ap_codes of the locations collected while playing it, including its floor's boss."""
+    floor_boss = {f"{int(data.region[0]) - 1}F": data.ap_code for data in boss_locations.values()}
+    stage_floor: Dict[str, str] = {}
+    level_checks: Dict[int, Set[int]] = {}
+    for name, data in stage_locations.items():
+        stage = name.split(":")[0]
+        stage_floor[stage] = SECRET_STAGE_FLOOR.get(stage, data.region)
+        # "Stage02: Red Gem(from Stage07)" is collected in Stage07
+        found_in = re.search(r"from (Stage\d+)", name)
+        if found_in:
+            stage = found_in.group(1)
+        level_checks.setdefault(getattr(LEVEL, stage), set()).add(data.ap_code)
+
+    for stage, floor in stage_floor.items():
+        level_checks[getattr(LEVEL, stage)].add(floor_boss[floor])
+    return level_checks
+
+
+LEVEL_CHECKS = build_level_checks()
+BOSS_CHECKS = frozenset(data.ap_code for data in boss_locations.values())
+FINAL_BOSS_CHECKS = frozenset([boss_locations["Boss05"].ap_code])
+
+
+class CheckPlanner:
+    """
+    Decides which locations to evaluate on each tick from the level transitions.
+
+    Stages and unknown levels (boss fights) visited since the last warp room visit are collected. Back in the warp room
+    only their locations are evaluated, for SETTLE_TICKS ticks. While in BOSS05 only Boss05 is watched.
+    Every other tick evaluates nothing.
+    """
+
+    def __init__(self, index: LocationCheckIndex):
+        self.index = index
+        self.machine = LevelStateMachine()
+        self.visited: Set[int] = set()
+        self.active: Optional[LocationCheckIndex] = None
+        self.entry_scan = False
+        self.settle: Optional[int] = None
+        self._subsets: Dict[FrozenSet[int], LocationCheckIndex] = {}
+
+        self.machine.on_enter(LEVEL.WarpRoom, self._enter_warp_room)
+        self.machine.on_enter(LEVEL.BOSS05, self._enter_final_boss)
+        self.machine.on_exit(LEVEL.WarpRoom, self._stop_watching)
+        self.machine.on_exit(LEVEL.BOSS05, self._stop_watching)
+        self.machine.on_enter(None, self._visit)
+
+    def subset(self, ap_codes: Iterable[int]) -> LocationCheckIndex:
+        key = frozenset(ap_codes)
+        if key not in self._subsets:
+            self._subsets[key] = self.index.subset(key)
+        return self._subsets[key]
+
+    def _watch(self, ap_codes: Set[int], settle: Optional[int]) -> None:
+        if ap_codes:
+            self.active = self.subset(ap_codes)
+            self.entry_scan = True
+            self.settle = settle
+
+    def _visit(self, level: int, previous: Optional[int]) -> None:
+        if level not in TRUSTED_LEVELS:
+            self.visited.add(level)
+
+    def _enter_warp_room(self, level: int, previous: Optional[int]) -> None:
+        ap_codes: Set[int] = set()
+        for visited in self.visited:
+            # Boss fights are not in LEVEL, so any unknown level may have set a boss flag
+            ap_codes |= LEVEL_CHECKS.get(visited, BOSS_CHECKS)
+        self.visited.clear()
+        self._watch(ap_codes, SETTLE_TICKS)
+
+    def _enter_final_boss(self, level: int, previous: Optional[int]) -> None:
+        self._watch(set(FINAL_BOSS_CHECKS), None)
+
+    def _stop_watching(self, level: int, next_level: Optional[int]) -> None:
+        self.active = None
+
+    def update(self, level: int) -> bool:
+        return self.machine.update(level)
+
+    def checks(self, previous: Optional[MemorySnapshot], current: MemorySnapshot) -> Set[int]:
+        """Locations found on this tick, after update() was called with its level."""
+        if self.active is None:
+            return set()
+        if self.entry_scan:
+            self.entry_scan = False
+            return self.active.scan(current)
+
+        found = self.active.diff(previous, current)
+        if self.settle is not None:
+            self.settle -= 1
+            if self.settle <= 0:
+                self.active = None
+        return found
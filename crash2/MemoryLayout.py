@@ -0,0 +1,79 @@
+import struct
+from typing import Any, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from .Crash2Addresses import DEFAULT_GAME_ID, LAYOUTS, LOCATIONS
+from .MemoryWatch import MemorySnapshot, MemoryWatchRegistry
+
+ID_FIELD = "GAME_ID"
+
+
+class FieldReader(NamedTuple):
+    """Decodes one layout field straight from a snapshot buffer, at an offset resolved once."""
+    unpack_from: Callable[..., tuple]
+    offset: int
+    scalar: bool
+
+    def __call__(self, snapshot: MemorySnapshot) -> Any:
+        values = self.unpack_from(snapshot.buffer, self.offset)
+        return values[0] if self.scalar else values
+
+
+class MemoryLayout:
+    """Fields of one game version, compiled into struct readers."""
+
+    def __init__(self, game_id: str, fields: Mapping[str, Tuple[int, str]]):
+        self.game_id = game_id
+        self.addresses: Dict[str, int] = {name: address for name, (address, _) in fields.items()}
+        self.structs: Dict[str, struct.Struct] = {name: struct.Struct("<" + fmt) for name, (_, fmt) in fields.items()}
+
+    def size(self, name: str) -> int:
+        return self.structs[name].size
+
+    def watch(self, registry: MemoryWatchRegistry, names: Iterable[str]) -> None:
+        for name in names:
+            registry.watch(name, self.addresses[name], self.size(name))
+
+    def readers(self, registry: MemoryWatchRegistry) -> Dict[str, FieldReader]:
+        """Readers for every field the registry watches."""
+        readers: Dict[str, FieldReader] = {}
+        for name, compiled in self.structs.items():
+            if name in registry.watches:
+                scalar = len(compiled.unpack(bytes(compiled.size))) == 1
+                readers[name] = FieldReader(compiled.unpack_from, registry.buffer_offset(self.addresses[name]), scalar)
+        return readers
+
+    def relocate(self, address: int) -> int:
+        """Moves an address of the default layout into this one, along with the field holding it."""
+        default = LAYOUT_BY_ID[DEFAULT_GAME_ID]
+        if self is default:
+            return address
+        for name, start in default.addresses.items():
+            if start <= address < start + default.size(name) and name in self.addresses:
+                return address - start + self.addresses[name]
+        raise KeyError(f"0x{address:X} is not in a field of the {self.game_id} layout")
+
+    def locations(self) -> List[dict]:
+        """LOCATIONS with the addresses of this version."""
+        return [{**location, "Address": self.relocate(location["Address"])} for location in LOCATIONS]
+
+
+LAYOUT_BY_ID: Dict[str, MemoryLayout] = {game_id: MemoryLayout(game_id, fields) for game_id, fields in LAYOUTS.items()}
+
+
+def id_window() -> Tuple[int, int]:
+    """(address, size) covering the ID field of every version, so one read identifies the game."""
+    start = min(layout.addresses[ID_FIELD] for layout in LAYOUT_BY_ID.values())
+    end = max(layout.addresses[ID_FIELD] + layout.size(ID_FIELD) for layout in LAYOUT_BY_ID.values())
+    return start, end - start
+
+
+ID_WINDOW = id_window()
+
+
+def detect_layout(data: bytes) -> Optional[MemoryLayout]:
+    """Layout of the version whose ID is in data, read from ID_WINDOW."""
+    for layout in LAYOUT_BY_ID.values():
+        offset = layout.addresses[ID_FIELD] - ID_WINDOW[0]
+        if layout.structs[ID_FIELD].unpack_from(data, offset)[0] == layout.game_id.encode("ascii"):
+            return layout
+    return None
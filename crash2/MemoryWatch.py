@@ -0,0 +1,111 @@
+import struct
+from bisect import bisect_right
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, TYPE_CHECKING
+
+import worlds._bizhawk as bizhawk
+if TYPE_CHECKING:
+    from worlds._bizhawk.context import BizHawkClientContext
+
+U16 = struct.Struct("<H")
+U32 = struct.Struct("<I")
+
+
+class Watch(NamedTuple):
+    name: str
+    address: int
+    size: int
+
+
+def buffer_offsets(ranges: Sequence[Tuple[int, int]]) -> List[int]:
+    """Offset of each range in the concatenated snapshot buffer."""
+    offsets: List[int] = []
+    total = 0
+    for _, size in ranges:
+        offsets.append(total)
+        total += size
+    return offsets
+
+
+class MemorySnapshot:
+    """
+    RAM windows fetched by one MemoryWatchRegistry.read call, also kept as one contiguous buffer.
+    blocks are the bytes objects of the read, one per range. Joining several of them copies them once into buffer;
+    block() then returns memoryview slices of buffer, which copy nothing.
+    """
+
+    def __init__(self, ranges: Sequence[Tuple[int, int]], blocks: Sequence[bytes]):
+        self.ranges = list(ranges)
+        self.blocks = list(blocks)
+        self.buffer = self.blocks[0] if len(self.blocks) == 1 else b"".join(self.blocks)
+        self.view = memoryview(self.buffer)
+        self._starts = [address for address, _ in self.ranges]
+        self._offsets = buffer_offsets(self.ranges)
+
+    def offset(self, address: int, size: int = 1) -> int:
+        """Offset of address in the buffer."""
+        idx = bisect_right(self._starts, address) - 1
+        if idx >= 0:
+            offset = address - self._starts[idx]
+            if offset + size <= self.ranges[idx][1]:
+                return self._offsets[idx] + offset
+        raise KeyError(f"0x{address:X} (+{size}) is not in a watched range")
+
+    def block(self, address: int, size: int) -> memoryview:
+        offset = self.offset(address, size)
+        return self.view[offset:offset + size]
+
+    def read8(self, address: int) -> int:
+        return self.buffer[self.offset(address)]
+
+    def read16(self, address: int) -> int:
+        return U16.unpack_from(self.buffer, self.offset(address, 2))[0]
+
+    def read32(self, address: int) -> int:
+        return U32.unpack_from(self.buffer, self.offset(address, 4))[0]
+
+
+class MemoryWatchRegistry:
+    """Every RAM window the client needs, declared once and fetched with a single bizhawk.read."""
+
+    def __init__(self, domain: str = "MainRAM"):
+        self.domain = domain
+        self.watches: Dict[str, Watch] = {}
+        self._ranges: Optional[List[Tuple[int, int]]] = None
+
+    def watch(self, name: str, address: int, size: int = 1) -> None:
+        self.watches[name] = Watch(name, address, size)
+        self._ranges = None
+
+    @property
+    def ranges(self) -> List[Tuple[int, int]]:
+        if self._ranges is None:
+            self.compile()
+        return self._ranges
+
+    def buffer_offset(self, address: int) -> int:
+        """Offset of a watched address in the buffer of the snapshots this registry reads."""
+        for (start, size), offset in zip(self.ranges, buffer_offsets(self.ranges)):
+            if start <= address < start + size:
+                return offset + address - start
+        raise KeyError(f"0x{address:X} is not watched")
+
+    @property
+    def size(self) -> int:
+        """Bytes fetched per read."""
+        return sum(size for _, size in self.ranges)
+
+    def compile(self) -> List[Tuple[int, int]]:
+        """Merges overlapping and adjacent watches into the fewest contiguous (address, size) ranges."""
+        merged: List[List[int]] = []
+        for start, end in sorted((w.address, w.address + w.size) for w in self.watches.values()):
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        self._ranges = [(start, end - start) for start, end in merged]
+        return self._ranges
+
+    async def read(self, ctx: "BizHawkClientContext") -> MemorySnapshot:
+        ranges = self.ranges
+        blocks = await bizhawk.read(ctx.bizhawk_ctx, [(address, size, self.domain) for address, size in ranges])
+        return MemorySnapshot(ranges, blocks)
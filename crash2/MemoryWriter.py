@@ -0,0 +1,55 @@
+from typing import Dict, List, Sequence, Set, Tuple, TYPE_CHECKING
+
+import worlds._bizhawk as bizhawk
+from .MemoryWatch import MemorySnapshot
+if TYPE_CHECKING:
+    from worlds._bizhawk.context import BizHawkClientContext
+
+
+def group_runs(changes: Sequence[Tuple[int, int]]) -> List[Tuple[int, List[int]]]:
+    """Packs sorted (address, value) pairs into (start, [values]) runs of consecutive addresses."""
+    runs: List[Tuple[int, List[int]]] = []
+    for address, value in changes:
+        if runs and runs[-1][0] + len(runs[-1][1]) == address:
+            runs[-1][1].append(value)
+        else:
+            runs.append((address, [value]))
+    return runs
+
+
+class ShadowMemory:
+    """Desired state of the RAM bytes the client manages, flushed as one batched write per tick."""
+
+    def __init__(self, domain: str = "MainRAM"):
+        self.domain = domain
+        self.desired: Dict[int, int] = {}
+        self.guarded: Set[int] = set()
+
+    def set8(self, address: int, value: int, guarded: bool = False) -> None:
+        """guarded: only write if the byte still holds the snapshot value, for bytes the game also writes."""
+        self.desired[address] = value & 0xFF
+        if guarded:
+            self.guarded.add(address)
+
+    def changes(self, snapshot: MemorySnapshot) -> List[Tuple[int, int]]:
+        return [(address, value) for address, value in sorted(self.desired.items())
+                if snapshot.read8(address) != value]
+
+    async def flush(self, ctx: "BizHawkClientContext", snapshot: MemorySnapshot) -> int:
+        """Writes the bytes that differ from the snapshot. Returns the number of bytes written."""
+        changes = self.changes(snapshot)
+        guards = [(address, [snapshot.read8(address)], self.domain)
+                  for address, _ in changes if address in self.guarded]
+        self.desired.clear()
+        self.guarded.clear()
+        if not changes:
+            return 0
+
+        write_list = [(address, values, self.domain) for address, values in group_runs(changes)]
+        if guards:
+            if not await bizhawk.guarded_write(ctx.bizhawk_ctx, write_list, guards):
+                # The game changed a guarded byte; desired state is recomputed next tick
+                return 0
+        else:
+            await bizhawk.write(ctx.bizhawk_ctx, write_list)
+        return len(changes)
@@ -1,7 +1,8 @@
 from typing import List, Dict, Any
 from dataclasses import dataclass
 from worlds.AutoWorld import PerGameCommonOptions
-from Options import Choice, OptionGroup, Toggle, DefaultOnToggle
+from Options import Choice, OptionDict, OptionGroup, Toggle, DefaultOnToggle
+from schema import And, Optional, Schema
 
 # Common variable
 GAME_TITLE="Crash2"
@@ -33,14 +34,33 @@ class UseProgressItemInsteadOfPowerStones(Choice):
     option_use_powerstone_as_vanilla = 1
     default = 0
 
+# Default weight of each filler item, see FillerWeights
+filler_weights: Dict[str, int] = {
+    "Apple" : 1,
+}
+
+class FillerWeights(OptionDict):
+    """
+    FillerWeights: Relative weight of each filler item in the item pool.
+    Weights are whole numbers of 0 or more, with at least one above 0.
+    """
+    display_name = "Filler Weights"
+    valid_keys = list(filler_weights)
+    default = dict(filler_weights)
+    schema = Schema(And(
+        {Optional(name): And(int, lambda n: n >= 0) for name in filler_weights},
+        Schema(lambda weights: any(weights.values()), error="At least one filler weight must be above 0"),
+    ))
+
 
 @dataclass
 class Crash2Options(PerGameCommonOptions):
     DummyOption:            DummyOption
     UseProgressItemInsteadOfPowerStones: UseProgressItemInsteadOfPowerStones
+    FillerWeights:          FillerWeights
 
 option_groups: Dict[str, List[Any]] = {
-    "General Options": [DummyOption, UseProgressItemInsteadOfPowerStones],
+    "General Options": [DummyOption, UseProgressItemInsteadOfPowerStones, FillerWeights],
 }
 
 slot_data_options: List[str] = {
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from .Crash2Addresses import LEVEL
+
+ENDING_LEVELS = (LEVEL.NormalED, LEVEL.BestED)
+
+
+@dataclass
+class PollPolicy:
+    """Seconds between game_watcher ticks."""
+    fast: float = 0.1      # right after a level transition, received item or memory change
+    max: float = 1.0       # ceiling of the back off while nothing changes
+    backoff: float = 2.0   # interval multiplier per idle tick
+    ending: float = 5.0    # on the ending screens
+
+    @classmethod
+    def from_settings(cls, settings) -> "PollPolicy":
+        return cls(fast=settings.poll_fast_ms / 1000,
+                   max=settings.poll_max_ms / 1000,
+                   backoff=max(1.0, settings.poll_backoff_percent / 100),
+                   ending=settings.poll_ending_ms / 1000)
+
+
+class PollScheduler:
+    """Picks the next poll interval from the current level and recent activity."""
+
+    def __init__(self, policy: Optional[PollPolicy] = None):
+        self.policy = policy or PollPolicy()
+        self.interval = self.policy.fast
+        self.last_level: Optional[int] = None
+
+    def update(self, level: int, active: bool) -> float:
+        policy = self.policy
+        if level in ENDING_LEVELS:
+            self.interval = policy.ending
+        elif active or level != self.last_level:
+            self.interval = policy.fast
+        else:
+            self.interval = min(self.interval * policy.backoff, policy.max)
+        self.last_level = level
+        return self.interval
@@ -0,0 +1,127 @@
+"""
+Compact append-only trace of the watched RAM windows, one frame per game_watcher tick.
+
+File layout (little endian):
+    header  "<4sH10sH": magic, version, game id, range count
+    ranges  "<II" each: address, size
+    frames  "<IdHH": tick, seconds since start, run count, payload size
+            then run count times "<HH" (offset, length) + changed bytes
+
+Offsets index the concatenation of all ranges. The first frame holds every byte, later ones only the changes.
+Every frame header has the same size and carries its payload size, so a reader can skip frames without decoding them.
+"""
+import mmap
+import struct
+import time
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from .MemoryWatch import MemorySnapshot
+
+MAGIC = b"C2RT"
+VERSION = 1
+FILE_HEADER = struct.Struct("<4sH10sH")
+RANGE = struct.Struct("<II")
+FRAME_HEADER = struct.Struct("<IdHH")
+RUN = struct.Struct("<HH")
+
+
+def diff_runs(old: Optional[bytes], new: bytes) -> List[Tuple[int, bytes]]:
+    """(offset, bytes) runs where new differs from old. Everything is one run when there is no old buffer."""
+    if old is None:
+        return [(0, new)]
+    runs: List[Tuple[int, bytes]] = []
+    start = None
+    for idx in range(len(new)):
+        if old[idx] != new[idx]:
+            if start is None:
+                start = idx
+        elif start is not None:
+            runs.append((start, new[start:idx]))
+            start = None
+    if start is not None:
+        runs.append((start, new[start:]))
+    return runs
+
+
+class TraceFrame(NamedTuple):
+    tick: int
+    timestamp: float
+    snapshot: MemorySnapshot
+
+
+class RamTraceWriter:
+    def __init__(self, path: str, ranges: Sequence[Tuple[int, int]], game_id: str):
+        self.path = path
+        self.ranges = list(ranges)
+        self.file: BinaryIO = open(path, "wb")
+        self.file.write(FILE_HEADER.pack(MAGIC, VERSION, game_id.encode("ascii"), len(self.ranges)))
+        for address, size in self.ranges:
+            self.file.write(RANGE.pack(address, size))
+        self.started = time.monotonic()
+        self.tick = 0
+        self._last: Optional[bytes] = None
+
+    def record(self, snapshot: MemorySnapshot) -> None:
+        if snapshot.ranges != self.ranges:
+            raise ValueError("Snapshot ranges do not match the trace")
+        current = b"".join(snapshot.blocks)
+        runs = diff_runs(self._last, current)
+        payload = b"".join(RUN.pack(offset, len(data)) + data for offset, data in runs)
+        self.file.write(FRAME_HEADER.pack(self.tick, time.monotonic() - self.started, len(runs), len(payload)))
+        self.file.write(payload)
+        self._last = current
+        self.tick += 1
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class RamTraceReader:
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, game_id, range_count = FILE_HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} RAM trace")
+        self.game_id = game_id.decode("ascii")
+        offset = FILE_HEADER.size
+        self.ranges: List[Tuple[int, int]] = []
+        for _ in range(range_count):
+            self.ranges.append(RANGE.unpack_from(self._mmap, offset))
+            offset += RANGE.size
+        self._frames_start = offset
+
+    def frame_offsets(self) -> Iterator[Tuple[int, int]]:
+        """(tick, file offset) of every frame, only touching the fixed size headers."""
+        offset = self._frames_start
+        end = len(self._mmap)
+        while offset + FRAME_HEADER.size <= end:
+            tick, _, _, payload_size = FRAME_HEADER.unpack_from(self._mmap, offset)
+            yield tick, offset
+            offset += FRAME_HEADER.size + payload_size
+
+    def frames(self) -> Iterator[TraceFrame]:
+        buffer = bytearray(sum(size for _, size in self.ranges))
+        data = self._mmap
+        offset = self._frames_start
+        end = len(data)
+        while offset + FRAME_HEADER.size <= end:
+            tick, timestamp, run_count, payload_size = FRAME_HEADER.unpack_from(data, offset)
+            position = offset + FRAME_HEADER.size
+            for _ in range(run_count):
+                run_offset, length = RUN.unpack_from(data, position)
+                position += RUN.size
+                buffer[run_offset:run_offset + length] = data[position:position + length]
+                position += length
+            offset += FRAME_HEADER.size + payload_size
+
+            blocks = []
+            start = 0
+            for _, size in self.ranges:
+                blocks.append(bytes(buffer[start:start + size]))
+                start += size
+            yield TraceFrame(tick, timestamp, MemorySnapshot(self.ranges, blocks))
+
+    def close(self) -> None:
+        self._mmap.close()
@@ -1,6 +1,6 @@
 from BaseClasses import Region, Location
 from typing import TYPE_CHECKING
-from .Locations import location_table
+from .Index import location_index
 from .Options import GAME_TITLE_FULL
 
 if TYPE_CHECKING:
@@ -31,10 +31,9 @@ def create_regions(world):
 def create_region(world, name: str) -> Region:
     reg = Region(name, world.player, world.multiworld)
 
-    for (key, data) in location_table.items():
-        if data.region == name:
-            location = Crash2Location(world.player, key, data.ap_code, reg)
-            reg.locations.append(location)
+    for key in location_index.names(name):
+        location = Crash2Location(world.player, key, location_index.name_to_code[key], reg)
+        reg.locations.append(location)
 
     world.multiworld.regions.append(reg)
     return reg
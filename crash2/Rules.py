@@ -1,88 +1,104 @@
 from worlds.generic.Rules import add_rule, set_rule
-from typing import TYPE_CHECKING
+from typing import Callable, Dict, Tuple, TYPE_CHECKING
 from .Options import GAME_TITLE_FULL, UseProgressItemInsteadOfPowerStones
 # from .Items import gadget_items
 
 if TYPE_CHECKING:
+    from BaseClasses import CollectionState
     from . import Crash2World
 
+Rule = Callable[["CollectionState"], bool]
+
+# Floor elevator: entrance -> floors unlocked
+FLOOR_ENTRANCES: Dict[str, int] = {
+    "1F -> 2F": 1,
+    "2F -> 3F": 2,
+    "3F -> 4F": 3,
+    "4F -> 5F": 4,
+    "5F -> 6F": 5,
+}
+
+# Location -> floors unlocked, for locations collected from a later stage
+FLOOR_LOCATIONS: Dict[str, int] = {
+    "Stage02: Red Gem(from Stage07)": 1,       # Stage2 Red gem needs Stage 7
+    "Stage07: White Gem1(from Stage13)": 2,    # Stage07 White Gem1 needs Stage13
+    "Stage14: White Gem1(from Stage17)": 3,    # Stage14 White Gem1 needs Stage17
+}
+
+# Derived values Crash2World.collect/remove keep next to the player's item counts
+FLOOR_KEY = "Crash2: Floors"
+GEM_MASK_KEY = "Crash2: Color Gem Mask"
+COLOR_GEM_BITS: Dict[str, int] = {
+    "Red Gem": 0x01,
+    "Blue Gem": 0x02,
+    "Yellow Gem": 0x04,
+    "Green Gem": 0x08,
+    "Purple Gem": 0x10,
+}
+
+# Location -> color gems needed
+GEM_LOCATIONS: Dict[str, Tuple[str, ...]] = {
+    "Stage03: White Gem1(need Blue Gem)": ("Blue Gem",),
+    "Stage06: White Gem(need Red Gem)": ("Red Gem",),
+    "Stage12: White Gem2(need Yellow Gem)": ("Yellow Gem",),
+    "Stage19: White Gem2(need Green Gem)": ("Green Gem",),
+    "Stage25: White Gem2(need All Color Gems)": ("Green Gem", "Red Gem", "Blue Gem", "Purple Gem", "Yellow Gem"),
+}
+
+
+def floor_item(use_progress_items: int) -> Tuple[str, int]:
+    """(item, count per floor) unlocking the floors for the UseProgressItemInsteadOfPowerStones choice."""
+    if use_progress_items == UseProgressItemInsteadOfPowerStones.option_use_progress_items:
+        return "Progressive Floor", 1
+    else: # UseProgressItemInsteadOfPowerStones.option_use_powerstone_as_vanilla
+        return "Power Stone", 5
+
+
+def update_progress(state: "CollectionState", player: int, item_name: str, floor_item_name: str, base_value: int) -> None:
+    """Refreshes the derived floor count or color gem mask after item_name was collected or removed."""
+    counts = state.prog_items[player]
+    if item_name == floor_item_name:
+        counts[FLOOR_KEY] = counts.get(item_name, 0) // base_value
+    elif item_name in COLOR_GEM_BITS:
+        bit = COLOR_GEM_BITS[item_name]
+        if counts.get(item_name, 0) > 0:
+            counts[GEM_MASK_KEY] = counts.get(GEM_MASK_KEY, 0) | bit
+        else:
+            counts[GEM_MASK_KEY] = counts.get(GEM_MASK_KEY, 0) & ~bit
+
+
+# Rules are single integer comparisons against the derived values
+def floor_rule(player: int, floors: int) -> Rule:
+    return lambda state: state.prog_items[player].get(FLOOR_KEY, 0) >= floors
+
+
+def gems_rule(gems: Tuple[str, ...], player: int) -> Rule:
+    mask = 0
+    for gem in gems:
+        mask |= COLOR_GEM_BITS[gem]
+    return lambda state: state.prog_items[player].get(GEM_MASK_KEY, 0) & mask == mask
+
+
+def compile_rules(player: int) -> Dict[str, Rule]:
+    """Entrance or location name -> its access rule, compiled from the tables above."""
+    rules: Dict[str, Rule] = {}
+    for name, floors in {**FLOOR_ENTRANCES, **FLOOR_LOCATIONS}.items():
+        rules[name] = floor_rule(player, floors)
+    for name, gems in GEM_LOCATIONS.items():
+        rules[name] = gems_rule(gems, player)
+    return rules
+
 
-def set_rules_floor(world):
-    options = world.options
-    # Progressive Item Option
-    if options.UseProgressItemInsteadOfPowerStones.value == UseProgressItemInsteadOfPowerStones.option_use_progress_items:
-        item_name = "Progressive Floor"
-        base_value = 1
-    else: # options.UseProgressItemInsteadOfPowerStones.value == UseProgressItemInsteadOfPowerStones.option_use_powerstone_as_vanilla:
-        item_name = "Power Stone"
-        base_value = 5
-
-    # Floor elevator
-    add_rule(world.multiworld.get_entrance("1F -> 2F", world.player),
-             lambda state: state.has(item_name, world.player, count=base_value*1))
-    add_rule(world.multiworld.get_entrance("2F -> 3F", world.player),
-             lambda state: state.has(item_name, world.player, count=base_value*2))
-    add_rule(world.multiworld.get_entrance("3F -> 4F", world.player),
-             lambda state: state.has(item_name, world.player, count=base_value*3))
-    add_rule(world.multiworld.get_entrance("4F -> 5F", world.player),
-             lambda state: state.has(item_name, world.player, count=base_value*4))
-    add_rule(world.multiworld.get_entrance("5F -> 6F", world.player),
-             lambda state: state.has(item_name, world.player, count=base_value*5))
-
-
-def set_rules_hard_location(world):
-    options = world.options
-    # Progressive Item Option
-    if options.UseProgressItemInsteadOfPowerStones.value == UseProgressItemInsteadOfPowerStones.option_use_progress_items:
-        item_name = "Progressive Floor"
-        base_value = 1
-    else: # options.UseProgressItemInsteadOfPowerStones.value == UseProgressItemInsteadOfPowerStones.option_use_powerstone_as_vanilla:
-        item_name = "Power Stone"
-        base_value = 5
-
-    ### Color Gem limitaion
-    # Stage3 White gem1 needs Blue gem
-    add_rule(world.multiworld.get_location("Stage03: White Gem1(need Blue Gem)", world.player),
-             lambda state: state.has("Blue Gem", world.player))
-    # Stage6 White gem1 needs Red gem
-    add_rule(world.multiworld.get_location("Stage06: White Gem(need Red Gem)", world.player),
-             lambda state: state.has("Red Gem", world.player))
-    # Stage12 White gem2 needs Yellow gem
-    add_rule(world.multiworld.get_location("Stage12: White Gem2(need Yellow Gem)", world.player),
-             lambda state: state.has("Yellow Gem", world.player))
-    # Stage19 White gem2 needs Green gem
-    add_rule(world.multiworld.get_location("Stage19: White Gem2(need Green Gem)", world.player),
-             lambda state: state.has("Green Gem", world.player))
-    # Stage25 White gem2 needs All color gems
-    add_rule(world.multiworld.get_location("Stage25: White Gem2(need All Color Gems)", world.player),
-             lambda state: state.has("Green Gem", world.player)
-             and state.has("Red Gem", world.player)
-             and state.has("Blue Gem", world.player)
-             and state.has("Purple Gem", world.player)
-             and state.has("Yellow Gem", world.player))
-
-    ### Floor limitation
-    # Stage2 Red gem needs Stage 7
-    add_rule(world.multiworld.get_location("Stage02: Red Gem(from Stage07)", world.player),
-             lambda state: state.has(item_name, world.player, count=base_value*1))
-    # Stage07 White Gem1 needs Stage13
-    add_rule(world.multiworld.get_location("Stage07: White Gem1(from Stage13)", world.player),
-             lambda state: state.has(item_name, world.player, count=base_value*2))
-    # Stage14 White Gem1 needs Stage17
-    add_rule(world.multiworld.get_location("Stage14: White Gem1(from Stage17)", world.player),
-             lambda state: state.has(item_name, world.player, count=base_value*3))
-
-
-    pass
-        
 def set_rules(world):
+    rules = compile_rules(world.player)
 
     # Rules for planets connection
-    set_rules_floor(world)
-    
+    for name in FLOOR_ENTRANCES:
+        add_rule(world.multiworld.get_entrance(name, world.player), rules[name])
+
     # Rules for hard to get Location
-    set_rules_hard_location(world)
+    for name in (*FLOOR_LOCATIONS, *GEM_LOCATIONS):
+        add_rule(world.multiworld.get_location(name, world.player), rules[name])
 
     #world.multiworld.completion_condition[world.player] = lambda state: state.has("Dr. Nefarious Defeated!", world.player)
     world.multiworld.completion_condition[world.player] = lambda state: state.has("Defeat Cortex!", world.player)
-
@@ -0,0 +1,323 @@
+# Generated by GenStaticData.py, do not edit. Rerun it after changing its tables:
+#     python crash2/GenStaticData.py
+
+# Location records: name -> (ap_code, region, address, bit)
+STAGE_LOCATIONS = {
+    'Stage01: Power Stone': (50000002, '1F', 0x6DBA3, 6),
+    'Stage01: White Gem': (50000003, '1F', 0x6DA27, 6),
+    'Stage01: Blue Gem(Not break boxes)': (50000004, '1F', 0x6DA2B, 5),
+    'Stage02: Power Stone': (50000101, '1F', 0x6DBA1, 6),
+    'Stage02: White Gem': (50000102, '1F', 0x6DA25, 6),
+    'Stage02: Red Gem(from Stage07)': (50000103, '1F', 0x6DA2B, 2),
+    'Stage03: Power Stone': (50000201, '1F', 0x6DBA3, 1),
+    'Stage03: White Gem1(need Blue Gem)': (50000202, '1F', 0x6DA27, 1),
+    'Stage03: White Gem2(time trial)': (50000203, '1F', 0x6DA24, 1),
+    'Stage04: Power Stone': (50000301, '1F', 0x6DBA3, 7),
+    'Stage04: White Gem': (50000302, '1F', 0x6DA27, 7),
+    'Stage05: Power Stone': (50000401, '1F', 0x6DBA3, 0),
+    'Stage05: White Gem': (50000402, '1F', 0x6DA27, 0),
+    'Stage06: Power Stone': (50000501, '2F', 0x6DBA2, 1),
+    'Stage06: White Gem(need Red Gem)': (50000502, '2F', 0x6DA26, 1),
+    'Stage07: Power Stone': (50000601, '2F', 0x6DBA4, 0),
+    'Stage07: White Gem1(from Stage13)': (50000602, '2F', 0x6DA28, 0),
+    'Stage07: White Gem2(Dokuro course)': (50000603, '2F', 0x6DA24, 2),
+    'Stage08: Power Stone': (50000701, '2F', 0x6DBA3, 5),
+    'Stage08: White Gem': (50000702, '2F', 0x6DA27, 5),
+    'Stage09: Power Stone': (50000801, '2F', 0x6DBA3, 3),
+    'Stage09: White Gem': (50000802, '2F', 0x6DA27, 3),
+    'Stage10: Power Stone': (50000901, '2F', 0x6DBA4, 3),
+    'Stage10: White Gem': (50000902, '2F', 0x6DA28, 3),
+    'Stage10: Green Gem': (50000903, '2F', 0x6DA2B, 3),
+    'Stage11: Power Stone': (50001001, '3F', 0x6DBA4, 1),
+    'Stage11: White Gem': (50001002, '3F', 0x6DA28, 1),
+    'Stage11: Yellow Gem(time trial)': (50001003, '3F', 0x6DA2B, 6),
+    'Stage12: Power Stone': (50001101, '3F', 0x6DBA1, 2),
+    'Stage12: White Gem1': (50001102, '3F', 0x6DA25, 2),
+    'Stage12: White Gem2(need Yellow Gem)': (50001103, '3F', 0x6DA24, 3),
+    'Stage13: Power Stone': (50001201, '3F', 0x6DBA4, 2),
+    'Stage13: White Gem': (50001202, '3F', 0x6DA28, 2),
+    'Stage14: Power Stone': (50001301, '3F', 0x6DBA2, 6),
+    'Stage14: White Gem1(from Stage17)': (50001302, '3F', 0x6DA26, 6),
+    'Stage14: White Gem2': (50001303, '3F', 0x6DA24, 4),
+    'Stage15: Power Stone': (50001401, '3F', 0x6DBA2, 7),
+    'Stage15: White Gem': (50001402, '3F', 0x6DA26, 7),
+    'Stage16: Power Stone': (50001501, '4F', 0x6DBA1, 5),
+    'Stage16: White Gem': (50001502, '4F', 0x6DA25, 5),
+    'Stage17: Power Stone': (50001601, '4F', 0x6DBA2, 5),
+    'Stage17: White Gem1': (50001602, '4F', 0x6DA26, 5),
+    'Stage17: White Gem2': (50001603, '4F', 0x6DA25, 0),
+    'Stage18: Power Stone': (50001701, '4F', 0x6DBA2, 3),
+    'Stage18: White Gem1': (50001702, '4F', 0x6DA26, 3),
+    'Stage18: White Gem2': (50001703, '4F', 0x6DA25, 1),
+    'Stage19: Power Stone': (50001801, '4F', 0x6DBA1, 7),
+    'Stage19: White Gem1': (50001802, '4F', 0x6DA25, 7),
+    'Stage19: White Gem2(need Green Gem)': (50001803, '4F', 0x6DA2B, 1),
+    'Stage20: Power Stone': (50001901, '4F', 0x6DBA4, 4),
+    'Stage20: White Gem': (50001902, '4F', 0x6DA28, 4),
+    'Stage20: Purple Gem': (50001903, '4F', 0x6DA2B, 4),
+    'Stage21: Power Stone': (50002001, '5F', 0x6DBA2, 0),
+    'Stage21: White Gem1': (50002002, '5F', 0x6DA26, 0),
+    'Stage21: White Gem2': (50002003, '5F', 0x6DA24, 5),
+    'Stage22: Power Stone': (50002101, '5F', 0x6DBA2, 2),
+    'Stage22: White Gem': (50002102, '5F', 0x6DA26, 2),
+    'Stage23: Power Stone': (50002201, '5F', 0x6DBA1, 4),
+    'Stage23: White Gem1': (50002202, '5F', 0x6DA25, 4),
+    'Stage23: White Gem2': (50002203, '5F', 0x6DA24, 6),
+    'Stage24: Power Stone': (50002301, '5F', 0x6DBA3, 2),
+    'Stage24: White Gem': (50002302, '5F', 0x6DA27, 2),
+    'Stage25: Power Stone': (50002401, '5F', 0x6DBA4, 6),
+    'Stage25: White Gem1': (50002402, '5F', 0x6DA28, 6),
+    'Stage25: White Gem2(need All Color Gems)': (50002403, '5F', 0x6DA24, 7),
+    'Stage26: White Gem': (50002501, 'Stage26', 0x6DA28, 5),
+    'Stage27: White Gem': (50002601, 'Stage27', 0x6DA28, 7),
+}
+BOSS_LOCATIONS = {
+    'Boss01': (50010001, '2F', 0x6D9D8, 6),
+    'Boss02': (50010002, '3F', 0x6D9D9, 0),
+    'Boss03': (50010003, '4F', 0x6D9D8, 3),
+    'Boss04': (50010004, '5F', 0x6D9D9, 1),
+    'Boss05': (50010005, '6F', 0x6D9D8, 7),
+}
+
+LOCATION_NAME_TO_ID = {
+    'Stage01: Power Stone': 50000002,
+    'Stage01: White Gem': 50000003,
+    'Stage01: Blue Gem(Not break boxes)': 50000004,
+    'Stage02: Power Stone': 50000101,
+    'Stage02: White Gem': 50000102,
+    'Stage02: Red Gem(from Stage07)': 50000103,
+    'Stage03: Power Stone': 50000201,
+    'Stage03: White Gem1(need Blue Gem)': 50000202,
+    'Stage03: White Gem2(time trial)': 50000203,
+    'Stage04: Power Stone': 50000301,
+    'Stage04: White Gem': 50000302,
+    'Stage05: Power Stone': 50000401,
+    'Stage05: White Gem': 50000402,
+    'Stage06: Power Stone': 50000501,
+    'Stage06: White Gem(need Red Gem)': 50000502,
+    'Stage07: Power Stone': 50000601,
+    'Stage07: White Gem1(from Stage13)': 50000602,
+    'Stage07: White Gem2(Dokuro course)': 50000603,
+    'Stage08: Power Stone': 50000701,
+    'Stage08: White Gem': 50000702,
+    'Stage09: Power Stone': 50000801,
+    'Stage09: White Gem': 50000802,
+    'Stage10: Power Stone': 50000901,
+    'Stage10: White Gem': 50000902,
+    'Stage10: Green Gem': 50000903,
+    'Stage11: Power Stone': 50001001,
+    'Stage11: White Gem': 50001002,
+    'Stage11: Yellow Gem(time trial)': 50001003,
+    'Stage12: Power Stone': 50001101,
+    'Stage12: White Gem1': 50001102,
+    'Stage12: White Gem2(need Yellow Gem)': 50001103,
+    'Stage13: Power Stone': 50001201,
+    'Stage13: White Gem': 50001202,
+    'Stage14: Power Stone': 50001301,
+    'Stage14: White Gem1(from Stage17)': 50001302,
+    'Stage14: White Gem2': 50001303,
+    'Stage15: Power Stone': 50001401,
+    'Stage15: White Gem': 50001402,
+    'Stage16: Power Stone': 50001501,
+    'Stage16: White Gem': 50001502,
+    'Stage17: Power Stone': 50001601,
+    'Stage17: White Gem1': 50001602,
+    'Stage17: White Gem2': 50001603,
+    'Stage18: Power Stone': 50001701,
+    'Stage18: White Gem1': 50001702,
+    'Stage18: White Gem2': 50001703,
+    'Stage19: Power Stone': 50001801,
+    'Stage19: White Gem1': 50001802,
+    'Stage19: White Gem2(need Green Gem)': 50001803,
+    'Stage20: Power Stone': 50001901,
+    'Stage20: White Gem': 50001902,
+    'Stage20: Purple Gem': 50001903,
+    'Stage21: Power Stone': 50002001,
+    'Stage21: White Gem1': 50002002,
+    'Stage21: White Gem2': 50002003,
+    'Stage22: Power Stone': 50002101,
+    'Stage22: White Gem': 50002102,
+    'Stage23: Power Stone': 50002201,
+    'Stage23: White Gem1': 50002202,
+    'Stage23: White Gem2': 50002203,
+    'Stage24: Power Stone': 50002301,
+    'Stage24: White Gem': 50002302,
+    'Stage25: Power Stone': 50002401,
+    'Stage25: White Gem1': 50002402,
+    'Stage25: White Gem2(need All Color Gems)': 50002403,
+    'Stage26: White Gem': 50002501,
+    'Stage27: White Gem': 50002601,
+    'Boss01': 50010001,
+    'Boss02': 50010002,
+    'Boss03': 50010003,
+    'Boss04': 50010004,
+    'Boss05': 50010005,
+}
+
+# Region -> its location names, in table order
+REGION_LOCATIONS = {
+    '1F': (
+        'Stage01: Power Stone',
+        'Stage01: White Gem',
+        'Stage01: Blue Gem(Not break boxes)',
+        'Stage02: Power Stone',
+        'Stage02: White Gem',
+        'Stage02: Red Gem(from Stage07)',
+        'Stage03: Power Stone',
+        'Stage03: White Gem1(need Blue Gem)',
+        'Stage03: White Gem2(time trial)',
+        'Stage04: Power Stone',
+        'Stage04: White Gem',
+        'Stage05: Power Stone',
+        'Stage05: White Gem',
+    ),
+    '2F': (
+        'Stage06: Power Stone',
+        'Stage06: White Gem(need Red Gem)',
+        'Stage07: Power Stone',
+        'Stage07: White Gem1(from Stage13)',
+        'Stage07: White Gem2(Dokuro course)',
+        'Stage08: Power Stone',
+        'Stage08: White Gem',
+        'Stage09: Power Stone',
+        'Stage09: White Gem',
+        'Stage10: Power Stone',
+        'Stage10: White Gem',
+        'Stage10: Green Gem',
+        'Boss01',
+    ),
+    '3F': (
+        'Stage11: Power Stone',
+        'Stage11: White Gem',
+        'Stage11: Yellow Gem(time trial)',
+        'Stage12: Power Stone',
+        'Stage12: White Gem1',
+        'Stage12: White Gem2(need Yellow Gem)',
+        'Stage13: Power Stone',
+        'Stage13: White Gem',
+        'Stage14: Power Stone',
+        'Stage14: White Gem1(from Stage17)',
+        'Stage14: White Gem2',
+        'Stage15: Power Stone',
+        'Stage15: White Gem',
+        'Boss02',
+    ),
+    '4F': (
+        'Stage16: Power Stone',
+        'Stage16: White Gem',
+        'Stage17: Power Stone',
+        'Stage17: White Gem1',
+        'Stage17: White Gem2',
+        'Stage18: Power Stone',
+        'Stage18: White Gem1',
+        'Stage18: White Gem2',
+        'Stage19: Power Stone',
+        'Stage19: White Gem1',
+        'Stage19: White Gem2(need Green Gem)',
+        'Stage20: Power Stone',
+        'Stage20: White Gem',
+        'Stage20: Purple Gem',
+        'Boss03',
+    ),
+    '5F': (
+        'Stage21: Power Stone',
+        'Stage21: White Gem1',
+        'Stage21: White Gem2',
+        'Stage22: Power Stone',
+        'Stage22: White Gem',
+        'Stage23: Power Stone',
+        'Stage23: White Gem1',
+        'Stage23: White Gem2',
+        'Stage24: Power Stone',
+        'Stage24: White Gem',
+        'Stage25: Power Stone',
+        'Stage25: White Gem1',
+        'Stage25: White Gem2(need All Color Gems)',
+        'Boss04',
+    ),
+    'Stage26': (
+        'Stage26: White Gem',
+    ),
+    'Stage27': (
+        'Stage27: White Gem',
+    ),
+    '6F': (
+        'Boss05',
+    ),
+}
+
+# Location name -> (address, bit) of its collected flag
+LOCATION_FLAGS = {
+    'Stage01: Power Stone': (0x6DBA3, 6),
+    'Stage01: White Gem': (0x6DA27, 6),
+    'Stage01: Blue Gem(Not break boxes)': (0x6DA2B, 5),
+    'Stage02: Power Stone': (0x6DBA1, 6),
+    'Stage02: White Gem': (0x6DA25, 6),
+    'Stage02: Red Gem(from Stage07)': (0x6DA2B, 2),
+    'Stage03: Power Stone': (0x6DBA3, 1),
+    'Stage03: White Gem1(need Blue Gem)': (0x6DA27, 1),
+    'Stage03: White Gem2(time trial)': (0x6DA24, 1),
+    'Stage04: Power Stone': (0x6DBA3, 7),
+    'Stage04: White Gem': (0x6DA27, 7),
+    'Stage05: Power Stone': (0x6DBA3, 0),
+    'Stage05: White Gem': (0x6DA27, 0),
+    'Stage06: Power Stone': (0x6DBA2, 1),
+    'Stage06: White Gem(need Red Gem)': (0x6DA26, 1),
+    'Stage07: Power Stone': (0x6DBA4, 0),
+    'Stage07: White Gem1(from Stage13)': (0x6DA28, 0),
+    'Stage07: White Gem2(Dokuro course)': (0x6DA24, 2),
+    'Stage08: Power Stone': (0x6DBA3, 5),
+    'Stage08: White Gem': (0x6DA27, 5),
+    'Stage09: Power Stone': (0x6DBA3, 3),
+    'Stage09: White Gem': (0x6DA27, 3),
+    'Stage10: Power Stone': (0x6DBA4, 3),
+    'Stage10: White Gem': (0x6DA28, 3),
+    'Stage10: Green Gem': (0x6DA2B, 3),
+    'Stage11: Power Stone': (0x6DBA4, 1),
+    'Stage11: White Gem': (0x6DA28, 1),
+    'Stage11: Yellow Gem(time trial)': (0x6DA2B, 6),
+    'Stage12: Power Stone': (0x6DBA1, 2),
+    'Stage12: White Gem1': (0x6DA25, 2),
+    'Stage12: White Gem2(need Yellow Gem)': (0x6DA24, 3),
+    'Stage13: Power Stone': (0x6DBA4, 2),
+    'Stage13: White Gem': (0x6DA28, 2),
+    'Stage14: Power Stone': (0x6DBA2, 6),
+    'Stage14: White Gem1(from Stage17)': (0x6DA26, 6),
+    'Stage14: White Gem2': (0x6DA24, 4),
+    'Stage15: Power Stone': (0x6DBA2, 7),
+    'Stage15: White Gem': (0x6DA26, 7),
+    'Stage16: Power Stone': (0x6DBA1, 5),
+    'Stage16: White Gem': (0x6DA25, 5),
+    'Stage17: Power Stone': (0x6DBA2, 5),
+    'Stage17: White Gem1': (0x6DA26, 5),
+    'Stage17: White Gem2': (0x6DA25, 0),
+    'Stage18: Power Stone': (0x6DBA2, 3),
+    'Stage18: White Gem1': (0x6DA26, 3),
+    'Stage18: White Gem2': (0x6DA25, 1),
+    'Stage19: Power Stone': (0x6DBA1, 7),
+    'Stage19: White Gem1': (0x6DA25, 7),
+    'Stage19: White Gem2(need Green Gem)': (0x6DA2B, 1),
+    'Stage20: Power Stone': (0x6DBA4, 4),
+    'Stage20: White Gem': (0x6DA28, 4),
+    'Stage20: Purple Gem': (0x6DA2B, 4),
+    'Stage21: Power Stone': (0x6DBA2, 0),
+    'Stage21: White Gem1': (0x6DA26, 0),
+    'Stage21: White Gem2': (0x6DA24, 5),
+    'Stage22: Power Stone': (0x6DBA2, 2),
+    'Stage22: White Gem': (0x6DA26, 2),
+    'Stage23: Power Stone': (0x6DBA1, 4),
+    'Stage23: White Gem1': (0x6DA25, 4),
+    'Stage23: White Gem2': (0x6DA24, 6),
+    'Stage24: Power Stone': (0x6DBA3, 2),
+    'Stage24: White Gem': (0x6DA27, 2),
+    'Stage25: Power Stone': (0x6DBA4, 6),
+    'Stage25: White Gem1': (0x6DA28, 6),
+    'Stage25: White Gem2(need All Color Gems)': (0x6DA24, 7),
+    'Stage26: White Gem': (0x6DA28, 5),
+    'Stage27: White Gem': (0x6DA28, 7),
+    'Boss01': (0x6D9D8, 6),
+    'Boss02': (0x6D9D9, 0),
+    'Boss03': (0x6D9D8, 3),
+    'Boss04': (0x6D9D9, 1),
+    'Boss05': (0x6D9D8, 7),
+}
@@ -0,0 +1,21 @@
+from typing import Any, Dict, Mapping, Optional
+
+# Universal Tracker regenerates a slot with the value interpret_slot_data returned in
+# multiworld.re_gen_passthrough[game]. It only needs the regions, rules and locked items to track a slot,
+# the items themselves come from the server.
+
+
+def get_tracker_slot_data(world) -> Optional[Dict[str, Any]]:
+    """Slot data Universal Tracker is regenerating world from, None during a normal generation."""
+    passthrough = getattr(world.multiworld, "re_gen_passthrough", None)
+    if not passthrough:
+        return None
+    return passthrough.get(world.game)
+
+
+def apply_slot_options(world, slot_data: Mapping[str, Any]) -> None:
+    """Sets the options fill_slot_data sent, in place of those of a yaml. Values are checked like yaml ones."""
+    for name, value in slot_data.get("options", {}).items():
+        option = getattr(world.options, name, None)
+        if option is not None:
+            setattr(world.options, name, type(option).from_any(value))
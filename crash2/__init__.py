@@ -1,23 +1,72 @@
-from typing import Dict
+from typing import Dict, ClassVar
+import settings
 from BaseClasses import MultiWorld, Item, ItemClassification, Tutorial
 from worlds.AutoWorld import World, CollectionState, WebWorld
-from .Items import item_table, create_itempool, create_item
-from .Locations import get_location_names, get_total_locations, get_level_locations, get_regions
+from .Items import create_itempool, create_item, get_filler_weights, place_victory_item
+from .Locations import get_total_locations
+from .Index import item_index, location_index
 from .Options import Crash2Options, GAME_TITLE, GAME_TITLE_FULL
 from .Regions import create_regions
-from .Rules import set_rules
-from typing import Dict, Optional, Mapping, Any
-from .Client import Crash2Client # Unused, but required to register with BizHawkClient 
+from .Rules import set_rules, floor_item, update_progress
+from .GenerationProfile import GenerationProfile, get_profile, profile_phase
+from .Tracker import apply_slot_options, get_tracker_slot_data
+from typing import Dict, Optional, Any, Tuple
+from .ClientShim import Crash2Client # Unused, but required to register with BizHawkClient 
 
 from worlds.LauncherComponents import Component, SuffixIdentifier, Type, components, launch_subprocess
-def run_client(_url: Optional[str] = None):
-    from .Crash2Client import launch_client
-    launch_subprocess(launch_client, name=f"{GAME_TITLE} Client")
+
+def run_client(*args: str):
+    from worlds._bizhawk.context import launch
+    launch_subprocess(launch, name="BizHawkClient", args=args)
+
+def run_headless(*args: str):
+    from .Daemon import launch_headless
+    launch_subprocess(launch_headless, name=f"{GAME_TITLE} Headless Client", args=args)
+
+def run_daemon(*args: str):
+    from .Daemon import launch_daemon
+    launch_subprocess(launch_daemon, name=f"{GAME_TITLE} Client Daemon", args=args)
 
 components.append(
     Component(f"{GAME_TITLE_FULL} Client", func=run_client, component_type=Type.CLIENT,
               file_identifier=SuffixIdentifier(".apcb2"))
 )
+components.append(
+    Component(f"{GAME_TITLE_FULL} Headless Client", func=run_headless, component_type=Type.CLIENT, cli=True)
+)
+components.append(
+    Component(f"{GAME_TITLE_FULL} Client Daemon", func=run_daemon, component_type=Type.CLIENT, cli=True)
+)
+class Crash2Settings(settings.Group):
+    class PollFastMs(int):
+        """Client poll interval (ms) right after a level transition or a received item"""
+
+    class PollMaxMs(int):
+        """Longest client poll interval (ms) while nothing changes"""
+
+    class PollBackoffPercent(int):
+        """Growth of the client poll interval per idle poll, in percent (200 doubles it)"""
+
+    class PollEndingMs(int):
+        """Client poll interval (ms) on the ending screens"""
+
+    class PerfDumpIntervalS(int):
+        """Seconds between client performance JSON dumps to the log, 0 to disable"""
+
+    class CheckBatchWindowMs(int):
+        """Location checks found within this many ms are sent to the server as one message"""
+
+    class GenerationProfileDir(str):
+        """Directory to write a JSON profile of the Crash 2 generation phases to, one file per seed. Empty to disable"""
+
+    poll_fast_ms: PollFastMs = PollFastMs(100)
+    poll_max_ms: PollMaxMs = PollMaxMs(1000)
+    poll_backoff_percent: PollBackoffPercent = PollBackoffPercent(200)
+    poll_ending_ms: PollEndingMs = PollEndingMs(5000)
+    perf_dump_interval_s: PerfDumpIntervalS = PerfDumpIntervalS(0)
+    check_batch_window_ms: CheckBatchWindowMs = CheckBatchWindowMs(250)
+    generation_profile_dir: GenerationProfileDir = GenerationProfileDir("")
+
 class Crash2Web(WebWorld):
     theme = "ocean"
     tutorials = [Tutorial(
@@ -37,62 +86,101 @@ class Crash2World(World):
     """
 
     game = GAME_TITLE_FULL
-    item_name_to_id = {name: data.ap_code for name, data in item_table.items()}
-    location_name_to_id = get_location_names()
+    item_name_to_id = dict(item_index.name_to_code)
+    location_name_to_id = dict(location_index.name_to_code)
     # Config for Universal Tracker
-    ut_can_gen_without_yaml = False
+    # The options are taken from the slot data, see generate_early
+    ut_can_gen_without_yaml = True
     disable_ut = False
 
-    location_name_groups = {}
-    for region in get_regions():
-        location_name_groups[region] = set(get_level_locations(region))
+    location_name_groups = {region: set(names) for region, names in location_index.groups.items()}
 
     options_dataclass = Crash2Options
     options = Crash2Options
+    settings: ClassVar[Crash2Settings]
+    settings_key = "crash2_options"
     web = Crash2Web()
 
     def __init__(self, multiworld: MultiWorld, player: int):
         super().__init__(multiworld, player)
+        self.total_locations: Optional[int] = None
+        self.generation_profile: Optional[GenerationProfile] = None
+        # (item, count per floor) of the floor progression, see Rules.floor_item
+        self.floor_progress: Optional[Tuple[str, int]] = None
+        # Slot data of a Universal Tracker regeneration
+        self.tracker_slot_data: Optional[Dict[str, Any]] = None
 
     def generate_early(self):
-        # starting_weapon = (weapon_type_to_name[WeaponType(self.options.StartingWeapon)])
-        # self.multiworld.push_precollected(self.create_item(starting_weapon))
-        pass
+        self.generation_profile = get_profile(self.multiworld, self.settings.generation_profile_dir)
+        with profile_phase(self, "generate_early"):
+            self.tracker_slot_data = get_tracker_slot_data(self)
+            if self.tracker_slot_data is not None:
+                apply_slot_options(self, self.tracker_slot_data)
+            self.floor_progress = floor_item(self.options.UseProgressItemInsteadOfPowerStones.value)
+            # starting_weapon = (weapon_type_to_name[WeaponType(self.options.StartingWeapon)])
+            # self.multiworld.push_precollected(self.create_item(starting_weapon))
+            pass
 
     def create_regions(self):
-        create_regions(self)
+        with profile_phase(self, "create_regions"):
+            create_regions(self)
 
     def create_items(self):
-        self.multiworld.itempool += create_itempool(self)
+        if self.tracker_slot_data is not None:
+            # The tracker gets the items from the server, so no pool or filler is rolled
+            place_victory_item(self)
+            return
+        with profile_phase(self, "create_items") as record:
+            itempool = create_itempool(self)
+            record["items"] = len(itempool)
+        self.multiworld.itempool += itempool
 
     def set_rules(self):
-        set_rules(self)
+        with profile_phase(self, "set_rules"):
+            set_rules(self)
 
     def create_item(self, name: str) -> Item:
         return create_item(self, name)
 
+    def get_filler_item_name(self) -> str:
+        weights = get_filler_weights(self)
+        return self.random.choices(list(weights.keys()), weights=list(weights.values()), k=1)[0]
+
     def fill_slot_data(self) -> Dict[str, object]:
-        slot_data: Dict[str, object] = {
-            "options": {
-                "DummyOption": self.options.DummyOption.value,
-                "UseProgressItemInsteadOfPowerStones": self.options.UseProgressItemInsteadOfPowerStones.value,
-            },
-            "Seed": self.multiworld.seed_name,  # to verify the server's multiworld
-            "Slot": self.multiworld.player_name[self.player],  # to connect to server
-            "TotalLocations": get_total_locations(self)
-        }
+        with profile_phase(self, "fill_slot_data"):
+            slot_data: Dict[str, object] = {
+                "options": {
+                    "DummyOption": self.options.DummyOption.value,
+                    "UseProgressItemInsteadOfPowerStones": self.options.UseProgressItemInsteadOfPowerStones.value,
+                },
+                "Seed": self.multiworld.seed_name,  # to verify the server's multiworld
+                "Slot": self.multiworld.player_name[self.player],  # to connect to server
+                "TotalLocations": get_total_locations(self)
+            }
 
         return slot_data
 
     def collect(self, state: "CollectionState", item: "Item") -> bool:
-        return super().collect(state, item)
+        change = super().collect(state, item)
+        if change:
+            self.update_progress(state, item)
+        return change
 
     def remove(self, state: "CollectionState", item: "Item") -> bool:
-        return super().remove(state, item)
+        change = super().remove(state, item)
+        if change:
+            self.update_progress(state, item)
+        return change
+
+    def update_progress(self, state: "CollectionState", item: "Item") -> None:
+        # Keeps the floor count and color gem mask the access rules compare against up to date
+        if self.floor_progress is None:
+            self.floor_progress = floor_item(self.options.UseProgressItemInsteadOfPowerStones.value)
+        update_progress(state, self.player, item.name, *self.floor_progress)
 
     # For Univesal Tracker integration
     @staticmethod
     def interpret_slot_data(slot_data: dict[str, Any]) -> dict[str, Any]:
-        # Trigger a regen in UT
+        # Trigger a regen in UT, which passes slot_data back through multiworld.re_gen_passthrough
         return slot_data
 
@@ -0,0 +1,184 @@
+"""
+In-process stand-in for connector_bizhawk_generic.lua.
+
+It speaks the same newline delimited JSON protocol as worlds._bizhawk and serves "MainRAM" from a bytearray,
+so the client can be tested and measured without an emulator. Used by the tests here and by the benchmarks.
+"""
+import asyncio
+import base64
+import json
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Set, TYPE_CHECKING
+
+from ..Crash2Addresses import ADDRESSES
+from ..MemoryWatch import MemorySnapshot
+if TYPE_CHECKING:
+    from worlds._bizhawk import BizHawkContext
+    from worlds._bizhawk.context import BizHawkClientContext
+
+SCRIPT_VERSION = 1
+MAIN_RAM_SIZE = 0x200000  # PSX 2MB
+
+
+class FakeBizHawk:
+    def __init__(self, game_id: str = "SCPS-10047", system: str = "PSX"):
+        self.system = system
+        self.domains: Dict[str, bytearray] = {"MainRAM": bytearray(MAIN_RAM_SIZE)}
+        self.game_id = game_id
+        addr = ADDRESSES[game_id]["GAME_ID"]
+        self.ram[addr:addr + len(game_id)] = game_id.encode("ascii")
+
+        self.request_counts: Counter = Counter()
+        self.messages = 0
+        self.tick = 0
+        self.script: Dict[int, List[Callable[["FakeBizHawk"], None]]] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writers: Set[asyncio.StreamWriter] = set()
+
+    @property
+    def ram(self) -> bytearray:
+        return self.domains["MainRAM"]
+
+    ###########################
+    # Scripted game behaviour #
+    ###########################
+    def set_level(self, level: int) -> None:
+        self.ram[ADDRESSES[self.game_id]["CurrentLevel"]] = level
+
+    def set_flag(self, address: int, bit: int, on: bool = True) -> None:
+        if on:
+            self.ram[address] |= (1 << bit)
+        else:
+            self.ram[address] &= ~(1 << bit) & 0xFF
+
+    def load_snapshot(self, snapshot: MemorySnapshot, domain: str = "MainRAM") -> None:
+        """Overwrites the snapshot's ranges, e.g. with a recorded RamTrace frame."""
+        memory = self.domains[domain]
+        for (address, size), block in zip(snapshot.ranges, snapshot.blocks):
+            memory[address:address + size] = block
+
+    def at(self, tick: int, action: Callable[["FakeBizHawk"], None]) -> None:
+        """Runs action when advance() reaches tick."""
+        self.script.setdefault(tick, []).append(action)
+
+    def advance(self) -> None:
+        self.tick += 1
+        for action in self.script.pop(self.tick, ()):
+            action(self)
+
+    ############
+    # Protocol #
+    ############
+    def handle_request(self, req: dict) -> dict:
+        req_type = req["type"]
+        self.request_counts[req_type] += 1
+        if req_type == "PING":
+            return {"type": "PONG"}
+        elif req_type == "SYSTEM":
+            return {"type": "SYSTEM_RESPONSE", "value": self.system}
+        elif req_type == "PREFERRED_CORES":
+            return {"type": "PREFERRED_CORES_RESPONSE", "value": {}}
+        elif req_type == "HASH":
+            return {"type": "HASH_RESPONSE", "value": self.game_id}
+        elif req_type == "MEMORY_SIZE":
+            return {"type": "MEMORY_SIZE_RESPONSE", "value": len(self.domains[req["domain"]])}
+        elif req_type == "LOCK":
+            return {"type": "LOCKED"}
+        elif req_type == "UNLOCK":
+            return {"type": "UNLOCKED"}
+        elif req_type == "GUARD":
+            expected = base64.b64decode(req["expected_data"])
+            memory = self.domains[req["domain"]]
+            actual = memory[req["address"]:req["address"] + len(expected)]
+            return {"type": "GUARD_RESPONSE", "value": actual == expected, "address": req["address"]}
+        elif req_type == "READ":
+            memory = self.domains[req["domain"]]
+            data = bytes(memory[req["address"]:req["address"] + req["size"]])
+            return {"type": "READ_RESPONSE", "value": base64.b64encode(data).decode("ascii")}
+        elif req_type == "WRITE":
+            data = base64.b64decode(req["value"])
+            self.domains[req["domain"]][req["address"]:req["address"] + len(data)] = data
+            return {"type": "WRITE_RESPONSE"}
+        elif req_type == "DISPLAY_MESSAGE":
+            return {"type": "DISPLAY_MESSAGE_RESPONSE"}
+        elif req_type == "SET_MESSAGE_INTERVAL":
+            return {"type": "SET_MESSAGE_INTERVAL_RESPONSE"}
+        return {"type": "ERROR", "err": f"Unknown command: {req_type}"}
+
+    def handle_message(self, message: str) -> str:
+        self.messages += 1
+        if message == "VERSION":
+            return str(SCRIPT_VERSION)
+
+        responses: List[dict] = []
+        for req in json.loads(message):
+            # Like the lua connector, everything after a failed guard fails too
+            if responses and responses[-1]["type"] == "GUARD_RESPONSE" and not responses[-1]["value"]:
+                responses.append({"type": "GUARD_RESPONSE", "value": False, "address": responses[-1]["address"]})
+            else:
+                responses.append(self.handle_request(req))
+        return json.dumps(responses)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._writers.add(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                writer.write(self.handle_message(line.decode("utf-8").strip()).encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Starts listening and returns the bound port."""
+        self._server = await asyncio.start_server(self._serve, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            for writer in list(self._writers):
+                writer.close()
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def connect(self, bizhawk_ctx: "BizHawkContext") -> None:
+        """Starts the server if needed and attaches bizhawk_ctx to it, skipping the port scan of bizhawk.connect."""
+        from worlds._bizhawk import ConnectionStatus
+        if self._server is None:
+            await self.start()
+        host, port = self._server.sockets[0].getsockname()[:2]
+        bizhawk_ctx.streams = await asyncio.open_connection(host, port)
+        bizhawk_ctx.connection_status = ConnectionStatus.TENTATIVE
+
+
+def setup_offline_slot(ctx: "BizHawkClientContext", slot_data: Optional[dict] = None) -> None:
+    """
+    Fills in what the server would provide after Connected and replaces send_msgs with a local stand-in
+    that accepts every LocationChecks immediately. Sent checks are collected in ctx.sent_checks.
+    """
+    from ..CheckOutbox import CheckOutbox
+    from ..Client import init_slot_state
+    from ..Locations import location_table
+
+    codes = {data.ap_code for data in location_table.values()}
+    ctx.slot_data = slot_data or {"options": {"UseProgressItemInsteadOfPowerStones": 0}, "Seed": "offline", "Slot": "offline"}
+    ctx.server_locations = codes
+    ctx.missing_locations = set(codes)
+    ctx.location_table = ctx.server_locations
+    ctx.sent_checks = []
+    init_slot_state(ctx, persistent=False)
+    ctx.check_outbox = CheckOutbox(window=0, connected=lambda _: True)
+
+    async def send_msgs(msgs):
+        for msg in msgs:
+            if msg["cmd"] == "LocationChecks":
+                ctx.sent_checks.extend(msg["locations"])
+                ctx.checked_locations.update(msg["locations"])
+                ctx.missing_locations.difference_update(msg["locations"])
+    ctx.send_msgs = send_msgs
@@ -0,0 +1,65 @@
+from unittest import IsolatedAsyncioTestCase
+
+from NetUtils import NetworkItem
+from worlds._bizhawk.context import BizHawkClientContext
+
+from ..ClientShim import Crash2Client
+from ..Crash2Addresses import LEVEL
+from ..Index import item_index, location_index
+from ..StaticData import LOCATION_FLAGS
+from .fake_bizhawk import FakeBizHawk, setup_offline_slot
+
+RED_GEM_LOCATION = "Stage02: Red Gem(from Stage07)"
+
+
+class TestColorGemChecks(IsolatedAsyncioTestCase):
+    """Color gem locations, played against the fake BizHawk connector."""
+
+    async def asyncSetUp(self) -> None:
+        self.fake = FakeBizHawk()
+        self.ctx = BizHawkClientContext(None, None)
+        await self.fake.connect(self.ctx.bizhawk_ctx)
+        self.client = Crash2Client()
+        self.assertTrue(await self.client.validate_rom(self.ctx))
+        setup_offline_slot(self.ctx)
+
+    async def asyncTearDown(self) -> None:
+        await self.fake.stop()
+
+    async def play(self, level: int, ticks: int = 10) -> None:
+        self.fake.set_level(level)
+        for _ in range(ticks):
+            await self.client.game_watcher(self.ctx)
+
+    def receive(self, item_name: str) -> None:
+        self.ctx.items_received.append(NetworkItem(item_index.name_to_code[item_name], 0, 1, 0))
+
+    async def test_received_red_gem_is_not_found_in_stage07(self) -> None:
+        self.receive("Red Gem")
+        await self.play(LEVEL.WarpRoom)
+        await self.play(LEVEL.Stage07)
+        await self.play(LEVEL.WarpRoom)
+        self.assertNotIn(location_index.code(RED_GEM_LOCATION), self.ctx.sent_checks)
+
+    async def test_red_gem_found_in_stage07(self) -> None:
+        self.receive("Red Gem")
+        await self.play(LEVEL.WarpRoom)
+        await self.play(LEVEL.Stage07)
+        self.fake.set_flag(*LOCATION_FLAGS[RED_GEM_LOCATION])
+        await self.play(LEVEL.WarpRoom)
+        self.assertIn(location_index.code(RED_GEM_LOCATION), self.ctx.sent_checks)
+
+    async def test_received_gems_are_not_found_when_connecting_in_a_stage(self) -> None:
+        # The first warp room tick scans every location, while the bits forced on in the stage are still set
+        self.receive("Blue Gem")
+        self.receive("Green Gem")
+        await self.play(LEVEL.Stage05)
+        await self.play(LEVEL.WarpRoom)
+        self.assertNotIn(location_index.code("Stage01: Blue Gem(Not break boxes)"), self.ctx.sent_checks)
+        self.assertNotIn(location_index.code("Stage10: Green Gem"), self.ctx.sent_checks)
+
+    async def test_gem_found_before_connecting_in_a_stage(self) -> None:
+        self.fake.set_flag(*LOCATION_FLAGS["Stage20: Purple Gem"])
+        await self.play(LEVEL.Stage05)
+        await self.play(LEVEL.WarpRoom)
+        self.assertIn(location_index.code("Stage20: Purple Gem"), self.ctx.sent_checks)
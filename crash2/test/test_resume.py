@@ -0,0 +1,35 @@
+import time
+from unittest import IsolatedAsyncioTestCase
+
+from worlds._bizhawk.context import BizHawkClientContext
+
+from ..ClientShim import Crash2Client
+from ..Crash2Addresses import ADDRESSES, LEVEL
+from .fake_bizhawk import FakeBizHawk, setup_offline_slot
+
+
+class TestClientResume(IsolatedAsyncioTestCase):
+    """The client cache resume, played against the fake BizHawk connector."""
+
+    async def asyncSetUp(self) -> None:
+        self.fake = FakeBizHawk()
+        self.ctx = BizHawkClientContext(None, None)
+        await self.fake.connect(self.ctx.bizhawk_ctx)
+        self.client = Crash2Client()
+        self.assertTrue(await self.client.validate_rom(self.ctx))
+        setup_offline_slot(self.ctx)
+
+    async def asyncTearDown(self) -> None:
+        await self.fake.stop()
+
+    async def test_memory_is_not_written_while_waiting_for_items(self) -> None:
+        power_stones = ADDRESSES[self.fake.game_id]["PowerStoneFlags"]
+        self.fake.ram[power_stones] = 0xff
+        # A cache covering items the server has not sent yet
+        self.ctx.resume_state = {"processed_item_count": 8}
+        self.ctx.resume_deadline = time.monotonic() + 60
+        self.fake.set_level(LEVEL.Stage01)
+        for _ in range(10):
+            await self.client.game_watcher(self.ctx)
+        self.assertEqual(self.fake.request_counts["WRITE"], 0)
+        self.assertEqual(self.fake.ram[power_stones], 0xff)